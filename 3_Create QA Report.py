@@ -6,8 +6,13 @@ Production Version - Clean and optimized.
 
 import streamlit as st
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import date, datetime
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import pandas as pd
 import os
 
 # Import helper modules
@@ -16,10 +21,13 @@ from QA_Report_Helper import (
     ExcelStyling,
     ValidationError,
     DataProcessor,
+    PreparedData,
+    RecordSet,
     ReportGenerator,
     ExcelExporter,
     EmailContentGenerator,
-    DataValidator
+    DataValidator,
+    NetworkFile
 )
 
 # Configure logging
@@ -27,17 +35,173 @@ logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+# Campaign IDs: letters, digits, underscores and hyphens, with at least one letter or digit
+_CAMPAIGN_ID_RE = re.compile(r"\A(?=[\w-]*[^\W_])[\w-]+\Z")
+
+# Report display order: (report name, heading HTML, message when the report has no rows)
+# Headings are rendered to HTML once at import instead of formatted on every display
+_REPORT_SECTIONS = tuple(
+    (report_name, f'<div class="custom-heading">📊 {heading}</div>', empty_message)
+    for report_name, heading, empty_message in (
+        ("Combined QA Report", "QA Summary", "No data available for QA summary."),
+        ("Segment Wise Qualified Count", "Segment Wise Qualified Count", "No qualified data available for this report."),
+        ("JT Persona Wise Qualified Count", "JT Persona Wise Qualified Count", "No qualified data available for this report."),
+        ("Agent Wise Summary", "Agent Wise Summary", "No data available for this report."),
+        ("Primary Reason Disqualified", "Primary Reason Disqualified", "No data available for this report."),
+    )
+)
+
+# Page stylesheet, whitespace-collapsed once at import so each rerun sends a compact payload
+_CUSTOM_CSS = " ".join(line.strip() for line in """
+<style>
+    .block-container {
+        padding-top: 2rem !important;
+        padding-bottom: 1rem !important;
+    }
+    .inspectra-hero {
+        background: linear-gradient(135deg, #00e4d0, #00c3ff);
+        padding: 1.2rem 2rem 1rem 2rem;
+        border-radius: 20px;
+        margin-top: 1rem;
+        margin-bottom: 1.3rem;
+        box-shadow: 0 8px 22px rgba(0,0,0,0.08);
+        display: flex;
+        justify-content: center;
+        animation: fadeInHero 1.2s;
+    }
+    @keyframes fadeInHero {
+        from { opacity: 0; transform: translateY(-32px);}
+        to   { opacity: 1; transform: translateY(0);}
+    }
+    .inspectra-inline {
+        display: inline-flex;
+        align-items: center;
+        gap: 1.3rem;
+        white-space: nowrap;
+    }
+    .inspectra-title {
+        font-size: 2.5rem;
+        font-weight: 900;
+        margin: 0;
+        color: #fff;
+        letter-spacing: -1.5px;
+        text-shadow: 0 2px 10px rgba(0,0,0,0.08);
+    }
+    .inspectra-divider {
+        font-weight: 400;
+        color: #004e66;
+        opacity: 0.35;
+    }
+    .inspectra-tagline {
+        font-size: 1.08rem;
+        font-weight: 500;
+        margin: 0;
+        color: #e3feff;
+        opacity: 0.94;
+        position: relative;
+        top: 2px;
+        letter-spacing: 0.5px;
+    }
+    .section {
+        background: #f6fafd;
+        border-radius: 1.2rem;
+        padding: 0.8rem 1.6rem 0.5rem 1.6rem;
+        margin-bottom: 1.1rem;
+        box-shadow: 0 1px 9px 0 rgba(60,95,246,0.10);
+        border-left: 5px solid #00c3ff;
+        animation: fadeInSection 0.85s;
+    }
+    @keyframes fadeInSection {
+        from { opacity: 0; transform: translateY(36px);}
+        to   { opacity: 1; transform: translateY(0);}
+    }
+    .section-title {
+        font-size: 1.15rem;
+        font-weight: 700;
+        color: #169bb6;
+        margin-bottom: 0rem;
+        margin-top: 0;
+        letter-spacing: -1px;
+        display: flex;
+        align-items: center;
+        gap: 8px;
+    }
+    .custom-heading {
+        font-size: 1.15rem;
+        font-weight: 700;
+        color: #169bb6;
+        margin-bottom: 1rem;
+        margin-top: 0;
+        letter-spacing: -1px;
+        display: flex;
+        align-items: center;
+        gap: 8px;
+    }
+</style>
+""".splitlines() if line.strip())
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_load(file_key: str, _uploaded_file) -> Tuple[List[str], RecordSet]:
+    """Parse a workbook once per file; the underscore keeps the file object out of the cache key."""
+    return DataProcessor(Config()).load_and_parse_excel(_uploaded_file)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_prepare(file_key: str, corrections_key: Tuple, headers: List[str], _records: RecordSet) -> PreparedData:
+    """Validate and clean a workbook once per file and set of applied corrections."""
+    return DataProcessor(Config()).prepare(headers, _records)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_reports(
+    data_key: Tuple,
+    date_column: str,
+    selected_date: date,
+    optional_reports: Tuple[str, ...],
+    _date_records: RecordSet,
+    _mtd_records: RecordSet,
+    _all_records: RecordSet
+) -> Dict[str, List[List[Any]]]:
+    """Build the report tables once per data set, date column, report date and optional report selection."""
+    report_specs = {
+        "Combined QA Report": (ReportGenerator.generate_combined_qa_report, _date_records, _mtd_records),
+        "Agent Wise Summary": (ReportGenerator.generate_agent_breakdown_report, _date_records),
+        "Primary Reason Disqualified": (ReportGenerator.generate_dq_reason_report, _date_records)
+    }
+    
+    if "segment" in optional_reports:
+        report_specs["Segment Wise Qualified Count"] = (ReportGenerator.generate_segment_wise_report, _all_records)
+    
+    if "jt_persona" in optional_reports:
+        report_specs["JT Persona Wise Qualified Count"] = (ReportGenerator.generate_jt_persona_wise_report, _all_records)
+    
+    # Reports are independent and only read the records, so build them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(report_specs), os.cpu_count() or 1)) as executor:
+        futures = {
+            name: executor.submit(generate, *args)
+            for name, (generate, *args) in report_specs.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
+
+
 class QAReportApp:
     """Main application class."""
     
     def __init__(self):
         self.config = Config()
         self.processor = DataProcessor(self.config)
-        self.report_generator = ReportGenerator()
-        self.excel_exporter = ExcelExporter(ExcelStyling())
-        self.email_generator = EmailContentGenerator()
         self.validator = DataValidator(self.config)
     
+    # Export helpers are only needed once reports are generated, so build them on first use
+    @cached_property
+    def excel_exporter(self) -> ExcelExporter:
+        return ExcelExporter(ExcelStyling(), use_xlsxwriter=self.config.USE_XLSXWRITER)
+    
+    @cached_property
+    def email_generator(self) -> EmailContentGenerator:
+        return EmailContentGenerator()
+    
     def run(self) -> None:
         """Run the Streamlit application."""
         st.set_page_config(
@@ -67,8 +231,9 @@ class QAReportApp:
                 if 'force_reprocess' in st.session_state:
                     del st.session_state.force_reprocess
                 
+                file_key = self._file_cache_key(uploaded_file)
                 with st.spinner("Processing file..."):
-                    headers, records = self.processor.load_and_parse_excel(uploaded_file)
+                    headers, records = _cached_load(file_key, uploaded_file)
                     
                     # Lead Status correction interface
                     if not st.session_state.get('corrections_reviewed', False):
@@ -78,7 +243,7 @@ class QAReportApp:
                             st.warning(f"⚠️ Found {len(issues)} Lead Status values that need correction")
                             user_corrections = self._show_correction_interface(issues)
                             
-                            if user_corrections is not None:
+                            if user_corrections:
                                 if st.button("✅ Apply Corrections and Continue", type="primary", key="apply_corrections"):
                                     with st.spinner("Applying corrections..."):
                                         corrected_records, correction_count = self.validator.apply_corrections(records, user_corrections)
@@ -88,6 +253,7 @@ class QAReportApp:
                                     st.session_state.corrections_reviewed = True
                                     st.session_state.correction_summary = self.validator.get_correction_summary()
                                     st.session_state.corrected_records = corrected_records
+                                    st.session_state.applied_corrections = tuple(user_corrections.items())
                                     st.rerun()
                                 else:
                                     return
@@ -98,27 +264,35 @@ class QAReportApp:
                                 else:
                                     return
                         else:
+                            # Nothing to review: start a fresh run that goes straight to validation
                             st.session_state.corrections_reviewed = True
-                    
-                    if 'corrected_records' in st.session_state:
-                        records = st.session_state.corrected_records
-                    
-                    self._validate_data(headers, records)
-                    cleaned_records = self.processor.clean_data(records)
-                    optional_columns = self.processor.check_optional_columns(headers)
-                    
-                    st.session_state.processed_data = {
-                        'headers': headers,
-                        'records': records,
-                        'cleaned_records': cleaned_records,
-                        'optional_columns': optional_columns
-                    }
-                    st.session_state.uploaded_file_name = uploaded_file.name
-                    st.session_state.date_selected = False
+                            st.rerun()
+                
+                if 'corrected_records' in st.session_state:
+                    records = st.session_state.corrected_records
+                
+                # Identifies the cleaned data: the source file plus the corrections applied to it
+                data_key = (file_key, st.session_state.get('applied_corrections', ()))
+                prepared = _cached_prepare(*data_key, headers, records)
+                self._validate_data(prepared)
+                cleaned_records = prepared.records
+                optional_columns = prepared.optional_columns
+                
+                # Only the cleaned frame is kept; the raw and corrected copies are not needed past this point
+                st.session_state.processed_data = {
+                    'data_key': data_key,
+                    'headers': headers,
+                    'cleaned_records': cleaned_records,
+                    'optional_columns': optional_columns
+                }
+                st.session_state.pop('corrected_records', None)
+                st.session_state.pop('applied_corrections', None)
+                st.session_state.uploaded_file_name = uploaded_file.name
+                st.session_state.date_selected = False
             else:
                 cached_data = st.session_state.processed_data
+                data_key = cached_data['data_key']
                 headers = cached_data['headers']
-                records = cached_data['records'] 
                 cleaned_records = cached_data['cleaned_records']
                 optional_columns = cached_data['optional_columns']
             
@@ -146,10 +320,9 @@ class QAReportApp:
             selected_date = st.session_state.get('selected_date')
             self.processor.date_column = date_column
             
-            date_filtered_records = self.processor.filter_records_by_date(cleaned_records, selected_date)
-            mtd_filtered_records = self.processor.filter_records_mtd(cleaned_records, selected_date)
+            date_filtered_records, mtd_filtered_records = self.processor.partition_by_date(cleaned_records, selected_date)
             
-            self._show_data_summary(date_filtered_records, mtd_filtered_records, selected_date)
+            self._show_data_summary((data_key, date_column, selected_date), date_filtered_records, mtd_filtered_records, selected_date)
             
             if st.session_state.get('correction_summary'):
                 with st.expander("✅ Data Corrections Applied"):
@@ -159,6 +332,8 @@ class QAReportApp:
             
             if st.button("📊 Generate QA Reports", type="primary"):
                 self._generate_and_display_reports(
+                    data_key,
+                    date_column,
                     date_filtered_records, 
                     mtd_filtered_records, 
                     cleaned_records,
@@ -174,50 +349,51 @@ class QAReportApp:
             logger.error(f"Unexpected error: {str(e)}")
             st.error(f"⚠️ An unexpected error occurred: {str(e)}")
     
-    def _show_correction_interface(self, issues: List[Dict]) -> Optional[Dict[str, str]]:
-        """Show interactive correction interface for Lead Status issues."""
+    @staticmethod
+    def _file_cache_key(uploaded_file) -> str:
+        """Identify a file for the parse cache: path and mtime on the share, content hash for uploads."""
+        if isinstance(uploaded_file, NetworkFile):
+            return uploaded_file.cache_key
+        return hashlib.md5(uploaded_file.getvalue()).hexdigest()
+    
+    def _show_correction_interface(self, issues: List[Dict]) -> Dict[str, str]:
+        """Show interactive correction interface for Lead Status issues; empty when every value is kept."""
         st.markdown('<div class="section-title">🔧 Lead Status Correction</div>', unsafe_allow_html=True)
         st.info("Please review and correct the invalid Lead Status values below. The system has detected variations that don't match the accepted values: 'Qualified' or 'Disqualified'")
         
-        user_corrections = {}
+        keep_option = "Keep as is (no correction)"
+        issues_df = pd.DataFrame({
+            "Current Value": [str(issue['original']) for issue in issues],
+            "Records Affected": [issue['count'] for issue in issues],
+            "Auto Suggestion": [issue['auto_suggestion'] or "" for issue in issues],
+            "Correction": [issue['auto_suggestion'] or keep_option for issue in issues]
+        })
+        
+        # One editor for every issue keeps the widget count (and rerun cost) constant
+        edited_df = st.data_editor(
+            issues_df,
+            column_config={
+                "Records Affected": st.column_config.NumberColumn(format="%d"),
+                "Correction": st.column_config.SelectboxColumn(
+                    options=list(self.config.ACCEPTED_LEAD_STATUS) + [keep_option],
+                    required=True,
+                    help="Select the appropriate Lead Status value"
+                )
+            },
+            disabled=["Current Value", "Records Affected", "Auto Suggestion"],
+            hide_index=True,
+            key="lead_status_corrections"
+        )
         
-        for idx, issue in enumerate(issues):
-            with st.expander(f"Issue {idx + 1}: '{issue['original']}' ({issue['count']} records)", expanded=True):
-                col1, col2 = st.columns([1, 2])
-                
-                with col1:
-                    st.write(f"**Current Value:** `{issue['original']}`")
-                    st.write(f"**Records Affected:** {issue['count']:,}")
-                    st.write(f"**Valid Options:** Qualified, Disqualified")
-                
-                with col2:
-                    st.write("**Select Correction:**")
-                    options = []
-                    
-                    if issue['auto_suggestion']:
-                        options.append(f"{issue['auto_suggestion']} ⭐ (Auto-suggested)")
-                    
-                    for valid_option in issue['valid_options']:
-                        if valid_option != issue['auto_suggestion']:
-                            options.append(valid_option)
-                    
-                    options.append("Keep as is (no correction)")
-                    
-                    selected = st.radio(
-                        f"Correct '{issue['original']}' to:",
-                        options=options,
-                        key=f"lead_status_correction_{idx}",
-                        help="Select the appropriate Lead Status value",
-                        label_visibility="collapsed"
-                    )
-                    
-                    if selected != "Keep as is (no correction)":
-                        corrected_value = selected.replace(" ⭐ (Auto-suggested)", "").strip()
-                        user_corrections[issue['original']] = corrected_value
+        user_corrections = {
+            issue['original']: correction
+            for issue, correction in zip(issues, edited_df["Correction"])
+            if correction != keep_option
+        }
         
-        return user_corrections if user_corrections else None
+        return user_corrections
     
-    def _handle_date_selection(self, headers: List[str], records: List[Dict[str, Any]]) -> tuple:
+    def _handle_date_selection(self, headers: List[str], records: RecordSet) -> tuple:
         """Handle date column detection and date selection."""
         st.markdown('<div class="section-title">📅 Date Selection</div>', unsafe_allow_html=True)
         
@@ -242,20 +418,37 @@ class QAReportApp:
             if not date_column:
                 return None, None
         
-        with st.spinner("Parsing dates..."):
-            parsed_dates = self.processor.parse_dates_from_records(records, date_column)
+        unique_dates = self._ensure_dates_parsed(records, date_column)
         
-        if not parsed_dates:
+        if not unique_dates:
             st.error(f"❌ Could not parse any valid dates from column '{date_column}'")
             st.info("Expected formats: 06-Nov-25, 06-11-2025, 2025-11-06, etc.")
             return None, None
         
-        unique_dates = self.processor.get_unique_dates()
-        
-        if not unique_dates:
-            st.error("No valid dates found in the selected column.")
+        selected_date = self._render_date_widget(unique_dates)
+        if not selected_date:
             return None, None
         
+        return date_column, selected_date
+    
+    def _ensure_dates_parsed(self, records: RecordSet, date_column: str) -> List[date]:
+        """Parse the date column once per record set and column, reusing the result on later reruns."""
+        cached = st.session_state.get('parsed_date_cache')
+        if cached is not None and cached[0] is records and cached[1] == date_column:
+            # Hand the parsed date Series back so date partitioning skips the re-parse
+            self.processor.restore_date_series(records, date_column, cached[3])
+            return cached[2]
+        
+        with st.spinner("Parsing dates..."):
+            self.processor.parse_dates_from_records(records, date_column)
+            unique_dates = self.processor.get_unique_dates()
+        
+        date_series = self.processor.get_date_series(records, date_column)
+        st.session_state.parsed_date_cache = (records, date_column, unique_dates, date_series)
+        return unique_dates
+    
+    def _render_date_widget(self, unique_dates: List[date]) -> Optional[date]:
+        """Render the report date selectbox and return the chosen date."""
         st.info(f"📊 Found data for {len(unique_dates)} unique dates: {unique_dates[0].strftime('%d-%b-%Y')} to {unique_dates[-1].strftime('%d-%b-%Y')}")
         
         date_options = [d.strftime('%d-%b-%Y') for d in unique_dates]
@@ -267,100 +460,13 @@ class QAReportApp:
         )
         
         if not selected_date_str:
-            return None, None
+            return None
         
-        selected_date = datetime.strptime(selected_date_str, '%d-%b-%Y').date()
-        return date_column, selected_date
+        return datetime.strptime(selected_date_str, '%d-%b-%Y').date()
     
     def _add_custom_styling(self) -> None:
         """Add custom CSS styling."""
-        st.markdown("""
-        <style>
-            .block-container {
-                padding-top: 2rem !important;
-                padding-bottom: 1rem !important;
-            }
-            .inspectra-hero {
-                background: linear-gradient(135deg, #00e4d0, #00c3ff);
-                padding: 1.2rem 2rem 1rem 2rem;
-                border-radius: 20px;
-                margin-top: 1rem;
-                margin-bottom: 1.3rem;
-                box-shadow: 0 8px 22px rgba(0,0,0,0.08);
-                display: flex;
-                justify-content: center;
-                animation: fadeInHero 1.2s;
-            }
-            @keyframes fadeInHero {
-                from { opacity: 0; transform: translateY(-32px);}
-                to   { opacity: 1; transform: translateY(0);}
-            }
-            .inspectra-inline {
-                display: inline-flex;
-                align-items: center;
-                gap: 1.3rem;
-                white-space: nowrap;
-            }
-            .inspectra-title {
-                font-size: 2.5rem;
-                font-weight: 900;
-                margin: 0;
-                color: #fff;
-                letter-spacing: -1.5px;
-                text-shadow: 0 2px 10px rgba(0,0,0,0.08);
-            }
-            .inspectra-divider {
-                font-weight: 400;
-                color: #004e66;
-                opacity: 0.35;
-            }
-            .inspectra-tagline {
-                font-size: 1.08rem;
-                font-weight: 500;
-                margin: 0;
-                color: #e3feff;
-                opacity: 0.94;
-                position: relative;
-                top: 2px;
-                letter-spacing: 0.5px;
-            }
-            .section {
-                background: #f6fafd;
-                border-radius: 1.2rem;
-                padding: 0.8rem 1.6rem 0.5rem 1.6rem;
-                margin-bottom: 1.1rem;
-                box-shadow: 0 1px 9px 0 rgba(60,95,246,0.10);
-                border-left: 5px solid #00c3ff;
-                animation: fadeInSection 0.85s;
-            }
-            @keyframes fadeInSection {
-                from { opacity: 0; transform: translateY(36px);}
-                to   { opacity: 1; transform: translateY(0);}
-            }
-            .section-title {
-                font-size: 1.15rem;
-                font-weight: 700;
-                color: #169bb6;
-                margin-bottom: 0rem;
-                margin-top: 0;
-                letter-spacing: -1px;
-                display: flex;
-                align-items: center;
-                gap: 8px;
-            }
-            .custom-heading {
-                font-size: 1.15rem;
-                font-weight: 700;
-                color: #169bb6;
-                margin-bottom: 1rem;
-                margin-top: 0;
-                letter-spacing: -1px;
-                display: flex;
-                align-items: center;
-                gap: 8px;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
     
     def _render_hero_section(self) -> None:
         """Render the hero section."""
@@ -407,8 +513,8 @@ class QAReportApp:
                     if st.button("🗑️ Clear", key="clear_upload", help="Remove uploaded file"):
                         keys_to_clear = [
                             'processed_data', 'uploaded_file_name', 'date_selected',
-                            'date_column', 'selected_date', 'reports', 'date_records',
-                            'mtd_records', 'corrections_reviewed', 'correction_summary',
+                            'date_column', 'selected_date', 'reports', 'parsed_date_cache', 'summary_cache',
+                            'corrections_reviewed', 'correction_summary',
                             'corrected_records'
                         ]
                         for key in keys_to_clear:
@@ -503,16 +609,13 @@ class QAReportApp:
                                                 with col_btn1:
                                                     if st.button("✅ Confirm and Load File", type="primary", key="confirm_file_load"):
                                                         with st.spinner("Reading file from network..."):
-                                                            file_content = file_selector.read_file(filepath)
+                                                            network_file = file_selector.open_file(filepath)
                                                         
-                                                        if file_content:
-                                                            import io
-                                                            uploaded_file = io.BytesIO(file_content)
-                                                            uploaded_file.name = filename
-                                                            uploaded_file.size = len(file_content)
+                                                        if network_file:
+                                                            uploaded_file = network_file
                                                             
                                                             st.success(f"✅ File loaded successfully: {filename}")
-                                                            st.session_state.network_file = uploaded_file
+                                                            st.session_state.network_file = network_file
                                                             st.session_state.network_file_name = filename
                                                             st.session_state.file_loaded = True
                                                         else:
@@ -523,7 +626,7 @@ class QAReportApp:
                                                         keys_to_clear = [
                                                             'network_file', 'network_file_name', 'file_loaded',
                                                             'processed_data', 'uploaded_file_name', 'date_selected',
-                                                            'date_column', 'selected_date', 'reports',
+                                                            'date_column', 'selected_date', 'reports', 'parsed_date_cache', 'summary_cache',
                                                             'corrections_reviewed', 'correction_summary', 'corrected_records'
                                                         ]
                                                         for key in keys_to_clear:
@@ -541,8 +644,8 @@ class QAReportApp:
                                                             keys_to_clear = [
                                                                 'network_file', 'network_file_name', 'file_loaded',
                                                                 'processed_data', 'uploaded_file_name', 'date_selected',
-                                                                'date_column', 'selected_date', 'reports', 'date_records',
-                                                                'mtd_records', 'corrections_reviewed', 'correction_summary',
+                                                                'date_column', 'selected_date', 'reports', 'parsed_date_cache', 'summary_cache',
+                                                                'corrections_reviewed', 'correction_summary',
                                                                 'corrected_records'
                                                             ]
                                                             for key in keys_to_clear:
@@ -585,33 +688,41 @@ class QAReportApp:
         """)
         st.markdown('</div>', unsafe_allow_html=True)
     
-    def _validate_data(self, headers: List[str], records: List[Dict[str, Any]]) -> None:
-        """Validate all data requirements."""
+    def _validate_data(self, prepared: PreparedData) -> None:
+        """Report the outcome of each validation check computed by DataProcessor.prepare."""
         validation_steps = [
-            ("Checking required columns", lambda: self.processor.validate_columns(headers)),
-            ("Validating lead status values", lambda: self.processor.validate_lead_status(records)),
-            ("Validating DQ reasons", lambda: self.processor.validate_dq_reasons(records))
+            ("Checking required columns", "columns"),
+            ("Validating lead status values", "lead_status"),
+            ("Validating DQ reasons", "dq_reason")
         ]
         
-        for step_name, validation_func in validation_steps:
-            try:
-                validation_func()
-                st.success(f"✅ {step_name} - Passed")
-            except ValidationError as e:
-                st.error(f"⚠️ {step_name} - {str(e)}")
-                raise
+        for step_name, check in validation_steps:
+            error = prepared.validation_errors.get(check)
+            if error:
+                st.error(f"⚠️ {step_name} - {error}")
+                raise ValidationError(error)
+            st.success(f"✅ {step_name} - Passed")
     
-    def _show_data_summary(self, date_records: List[Dict[str, Any]], mtd_records: List[Dict[str, Any]], selected_date: date) -> None:
-        """Show data summary statistics."""
+    def _show_data_summary(self, summary_key: Tuple, date_records: RecordSet, mtd_records: RecordSet, selected_date: date) -> None:
+        """Show data summary statistics; counts are reused across reruns while summary_key is unchanged."""
         st.markdown('<div class="section-title">📈 Data Summary</div>', unsafe_allow_html=True)
         
+        # One counting pass per record set covers every status metric, and widget reruns skip it entirely
+        cached = st.session_state.get('summary_cache')
+        if cached is not None and cached[0] == summary_key:
+            daily_counts, mtd_counts = cached[1]
+        else:
+            daily_counts = self._status_counts(date_records)
+            mtd_counts = self._status_counts(mtd_records)
+            st.session_state.summary_cache = (summary_key, (daily_counts, mtd_counts))
+        
         daily_total = len(date_records)
-        daily_qualified = sum(1 for r in date_records if DataProcessor.normalize(r.get("Lead Status", "")) == "qualified")
-        daily_disqualified = sum(1 for r in date_records if DataProcessor.normalize(r.get("Lead Status", "")) == "disqualified")
+        daily_qualified = daily_counts.get("qualified", 0)
+        daily_disqualified = daily_counts.get("disqualified", 0)
         
         mtd_total = len(mtd_records)
-        mtd_qualified = sum(1 for r in mtd_records if DataProcessor.normalize(r.get("Lead Status", "")) == "qualified")
-        mtd_disqualified = sum(1 for r in mtd_records if DataProcessor.normalize(r.get("Lead Status", "")) == "disqualified")
+        mtd_qualified = mtd_counts.get("qualified", 0)
+        mtd_disqualified = mtd_counts.get("disqualified", 0)
         
         st.write(f"**Selected Date: {selected_date.strftime('%d-%b-%Y')}**")
         
@@ -643,6 +754,11 @@ class QAReportApp:
                 mtd_qual_rate = (mtd_qualified / mtd_total * 100) if mtd_total > 0 else 0
                 st.metric("Qual Rate", f"{mtd_qual_rate:.1f}%")
     
+    @staticmethod
+    def _status_counts(records: RecordSet) -> Dict[str, int]:
+        """Count records per normalized Lead Status."""
+        return DataProcessor.normalized_lead_status(records).value_counts().to_dict()
+    
     def _show_optional_report_selection(self, optional_columns: Dict[str, bool]) -> Dict[str, bool]:
         """Show optional report selection checkboxes."""
         optional_reports = {}
@@ -679,86 +795,45 @@ class QAReportApp:
     
     def _generate_and_display_reports(
         self, 
-        date_records: List[Dict[str, Any]], 
-        mtd_records: List[Dict[str, Any]],
-        all_records: List[Dict[str, Any]],
+        data_key: Tuple,
+        date_column: str,
+        date_records: RecordSet, 
+        mtd_records: RecordSet,
+        all_records: RecordSet,
         optional_reports: Dict[str, bool],
         selected_date: date
     ) -> None:
         """Generate and display all reports."""
         with st.spinner("Generating reports..."):
-            reports = {
-                "Combined QA Report": self.report_generator.generate_combined_qa_report(date_records, mtd_records),
-                "Agent Wise Summary": self.report_generator.generate_agent_breakdown_report(date_records),
-                "Primary Reason Disqualified": self.report_generator.generate_dq_reason_report(date_records)
-            }
-            
-            if optional_reports.get("segment", False):
-                reports["Segment Wise Qualified Count"] = self.report_generator.generate_segment_wise_report(all_records)
-            
-            if optional_reports.get("jt_persona", False):
-                reports["JT Persona Wise Qualified Count"] = self.report_generator.generate_jt_persona_wise_report(all_records)
+            enabled_reports = tuple(name for name, enabled in optional_reports.items() if enabled)
+            # The date column is part of the key: the same date picked from another column selects other records
+            reports = _cached_reports(data_key, date_column, selected_date, enabled_reports, date_records, mtd_records, all_records)
             
             st.session_state.reports = reports
-            st.session_state.date_records = date_records
-            st.session_state.mtd_records = mtd_records
             
             st.success("✅ Reports generated successfully!")
             st.info(f"📅 Reports generated for: **{selected_date.strftime('%d-%b-%Y')}** | MTD: **From earliest data to {selected_date.strftime('%d-%b-%Y')}**")
             
-            self._display_combined_qa_report(reports)
-            self._display_optional_reports(reports, optional_reports)
-            self._display_core_reports(reports)
+            self._display_reports(reports)
             self._show_download_section()
     
-    def _display_combined_qa_report(self, reports: Dict[str, List[List[Any]]]) -> None:
-        """Display the combined QA report."""
-        st.markdown('<div class="custom-heading">📊 QA Summary</div>', unsafe_allow_html=True)
-        
-        combined_data = reports["Combined QA Report"]
-        if combined_data and len(combined_data) > 1:
-            table_dict = self._convert_to_table_dict(combined_data)
-            st.table(table_dict)
-        else:
-            st.info("No data available for QA summary.")
-    
-    def _display_optional_reports(self, reports: Dict[str, List[List[Any]]], optional_reports: Dict[str, bool]) -> None:
-        """Display optional reports if they were generated."""
-        optional_report_names = ["Segment Wise Qualified Count", "JT Persona Wise Qualified Count"]
-        
-        for report_name in optional_report_names:
-            if report_name in reports:
-                st.markdown(f'<div class="custom-heading">📊 {report_name}</div>', unsafe_allow_html=True)
-                report_data = reports[report_name]
-                if report_data and len(report_data) > 1:
-                    table_dict = self._convert_to_table_dict(report_data)
-                    st.table(table_dict)
-                else:
-                    st.info("No qualified data available for this report.")
-    
-    def _display_core_reports(self, reports: Dict[str, List[List[Any]]]) -> None:
-        """Display core reports (Agent Wise Summary and Primary Reason Disqualified)."""
-        core_report_order = ["Agent Wise Summary", "Primary Reason Disqualified"]
-        
-        for report_name in core_report_order:
-            if report_name in reports:
-                st.markdown(f'<div class="custom-heading">📊 {report_name}</div>', unsafe_allow_html=True)
-                report_data = reports[report_name]
-                if report_data and len(report_data) > 1:
-                    table_dict = self._convert_to_table_dict(report_data)
-                    st.table(table_dict)
-                else:
-                    st.info("No data available for this report.")
+    def _display_reports(self, reports: Dict[str, List[List[Any]]]) -> None:
+        """Display the generated reports in a single ordered pass."""
+        for report_name, heading_html, empty_message in _REPORT_SECTIONS:
+            if report_name not in reports:
+                continue
+            
+            st.markdown(heading_html, unsafe_allow_html=True)
+            report_data = reports[report_name]
+            if report_data and len(report_data) > 1:
+                st.table(self._to_table_frame(report_data))
+            else:
+                st.info(empty_message)
     
-    def _convert_to_table_dict(self, report_data: List[List[Any]]) -> Dict[str, List[Any]]:
-        """Convert report data to dictionary for st.table() display."""
-        table_dict = {}
-        headers = report_data[0]
-        
-        for i, header in enumerate(headers):
-            table_dict[header] = [row[i] for row in report_data[1:]]
-        
-        return table_dict
+    @staticmethod
+    def _to_table_frame(report_data: List[List[Any]]) -> pd.DataFrame:
+        """Convert report rows (header row first) to a DataFrame for st.table() display."""
+        return pd.DataFrame(report_data[1:], columns=report_data[0])
     
     def _show_download_section(self):
         """Show download section with campaign ID input."""
@@ -786,7 +861,7 @@ class QAReportApp:
         """Validate and return campaign ID if valid."""
         if campaign_id.strip():
             campaign_id = campaign_id.strip()
-            if campaign_id.replace('_', '').replace('-', '').isalnum():
+            if _CAMPAIGN_ID_RE.match(campaign_id):
                 st.success(f"✅ Campaign ID: {campaign_id}")
                 return campaign_id
             else:
@@ -5,11 +5,11 @@ A modular package for QA report generation functionality.
 
 from .config import Config, ExcelStyling
 from .exceptions import ValidationError
-from .data_processor import DataProcessor
+from .data_processor import DataProcessor, PreparedData, RecordSet
 from .report_generator import ReportGenerator
 from .excel_exporter import ExcelExporter
 from .email_generator import EmailContentGenerator
-from .file_selector import FileSelector
+from .file_selector import FileSelector, NetworkFile
 from .data_validator import DataValidator
 
 __version__ = "1.0.2"
@@ -20,9 +20,12 @@ __all__ = [
     "ExcelStyling", 
     "ValidationError",
     "DataProcessor",
+    "PreparedData",
+    "RecordSet",
     "ReportGenerator",
     "ExcelExporter",
     "EmailContentGenerator",
     "FileSelector",
+    "NetworkFile",
     "DataValidator"
 ]
\ No newline at end of file
@@ -3,8 +3,11 @@ Configuration classes for QA Report Helper package.
 """
 
 from dataclasses import dataclass
-from typing import Tuple
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from functools import cached_property
+from typing import TYPE_CHECKING, FrozenSet, Tuple
+
+if TYPE_CHECKING:
+    from openpyxl.styles import PatternFill, Font, Alignment, Border
 
 
 @dataclass(frozen=True)
@@ -23,17 +26,57 @@ class Config:
     )
     MAX_FILE_SIZE_MB: int = 50
     SUPPORTED_EXTENSIONS: Tuple[str, ...] = ('xlsx', 'xlsm')
+    USE_XLSXWRITER: bool = False  # Write the Excel report with XlsxWriter when it is installed
+    
+    @cached_property
+    def ACCEPTED_LEAD_STATUS_SET(self) -> FrozenSet[str]:
+        """Accepted Lead Status values, stripped and lowercased once for membership tests."""
+        return frozenset(status.strip().lower() for status in self.ACCEPTED_LEAD_STATUS)
+    
+    @cached_property
+    def REQUIRED_COLUMNS_LOWER(self) -> Tuple[str, ...]:
+        """Required column names lowercased once, in the same order as REQUIRED_COLUMNS."""
+        return tuple(col.lower() for col in self.REQUIRED_COLUMNS)
+    
+    @cached_property
+    def OPTIONAL_COLUMNS_LOWER(self) -> Tuple[str, ...]:
+        """Optional column names lowercased once, in the same order as OPTIONAL_COLUMNS."""
+        return tuple(col.lower() for col in self.OPTIONAL_COLUMNS)
 
 
 @dataclass(frozen=True)
 class ExcelStyling:
-    """Excel styling configuration."""
-    header_fill: PatternFill = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
-    header_font: Font = Font(bold=True)
-    grand_total_fill: PatternFill = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
-    grand_total_font: Font = Font(bold=True)
-    center_alignment: Alignment = Alignment(horizontal="center", vertical="center")
-    thin_border: Border = Border(
-        left=Side(style="thin"), right=Side(style="thin"),
-        top=Side(style="thin"), bottom=Side(style="thin")
-    )
\ No newline at end of file
+    """Excel styling configuration, built on first use so importing the package does not load openpyxl."""
+    
+    @cached_property
+    def header_fill(self) -> "PatternFill":
+        from openpyxl.styles import PatternFill
+        return PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
+    
+    @cached_property
+    def header_font(self) -> "Font":
+        from openpyxl.styles import Font
+        return Font(bold=True)
+    
+    @cached_property
+    def grand_total_fill(self) -> "PatternFill":
+        from openpyxl.styles import PatternFill
+        return PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
+    
+    @cached_property
+    def grand_total_font(self) -> "Font":
+        from openpyxl.styles import Font
+        return Font(bold=True)
+    
+    @cached_property
+    def center_alignment(self) -> "Alignment":
+        from openpyxl.styles import Alignment
+        return Alignment(horizontal="center", vertical="center")
+    
+    @cached_property
+    def thin_border(self) -> "Border":
+        from openpyxl.styles import Border, Side
+        return Border(
+            left=Side(style="thin"), right=Side(style="thin"),
+            top=Side(style="thin"), bottom=Side(style="thin")
+        )
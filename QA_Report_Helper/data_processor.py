@@ -2,12 +2,17 @@
 Data processing and validation logic for QA Report Helper package.
 Updated to parse data from two sheets: "Qualified" and "Disqualified"
 Added support for date-based filtering and reporting.
+Records are kept as a columnar DataFrame (RecordSet) from load to report.
 """
 
 import logging
-from typing import Dict, List, Tuple, Any, Optional
-from openpyxl import load_workbook
-from datetime import datetime, date
+import re
+import sys
+from importlib.util import find_spec
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple, Any, Optional, Callable
+from datetime import datetime, date, time
+import numpy as np
 import pandas as pd
 
 from .config import Config
@@ -16,85 +21,362 @@ from .exceptions import ValidationError
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# python-calamine parses xlsx in Rust; without it pandas streams the sheets through openpyxl in read-only mode
+EXCEL_ENGINE = "calamine" if find_spec("python_calamine") else "openpyxl"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_text(text: str) -> str:
+    """
+    Strip and lowercase a string; cached because the same few statuses repeat constantly.
+    Interned so equal results share one object and compare against literals like "qualified" by identity.
+    """
+    return sys.intern(text.strip().lower())
+
+
+# Excel serial day numbers count 1900-01-01 as day 1; results must stay within Python's date range
+_EXCEL_DAY_ONE = np.datetime64("1900-01-01", "D")
+_EXCEL_MIN_OFFSET = (date.min - date(1900, 1, 1)).days
+_EXCEL_MAX_OFFSET = (date.max - date(1900, 1, 1)).days
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _excel_serial(value: Any) -> float:
+    """The Excel serial day number a numeric cell holds, or NaN when parse_date would not read it as one."""
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, float, np.integer, np.floating)):
+        return np.nan
+    # Same text test as parse_date, which rejects e.g. exponent notation and inf
+    date_str = str(value).strip()
+    if not date_str.replace('.', '').replace('-', '').isdigit():
+        return np.nan
+    return float(date_str)
+
+
+def _excel_serials_to_dates(serials: np.ndarray) -> np.ndarray:
+    """Vectorized form of parse_date's Excel serial branch; NaT where the date would overflow."""
+    # Excel counts a phantom 1900-02-29, so serials after 59 are one day late
+    offsets = np.where(serials > 59, serials - 1, serials) - 1
+    whole_days = np.floor(offsets)
+    # timedelta rounds to the microsecond, which carries values just before midnight into the next day
+    whole_days += (offsets - whole_days) * _MICROSECONDS_PER_DAY >= _MICROSECONDS_PER_DAY - 0.5
+    
+    valid = (whole_days >= _EXCEL_MIN_OFFSET) & (whole_days <= _EXCEL_MAX_OFFSET)
+    days = _EXCEL_DAY_ONE + np.where(valid, whole_days, 0).astype(np.int64).astype("timedelta64[D]")
+    dates = days.astype("datetime64[s]")
+    dates[~valid] = np.datetime64("NaT")
+    return dates
+
+
+# infer_dtype results for columns that mix value kinds, where equal values of different types can meet
+_MIXED_DTYPES = frozenset({"mixed", "mixed-integer", "mixed-integer-float"})
+
+
+@lru_cache(maxsize=8)
+def _lowercase_headers(headers: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased header set, shared by the required and optional column checks of one workbook."""
+    return frozenset(h.lower() for h in headers)
+
+
+def _convert_calamine_cell(value: Any) -> Any:
+    """Convert a raw calamine cell the way pandas' calamine reader does."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    # Plain dates become datetimes, matching the openpyxl reader
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+# Month names accepted by strptime's %b and %B (C locale), matched case-insensitively
+_MONTH_ABBREVIATIONS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december"
+)
+_MONTH_NUMBERS = {
+    **{name: number for number, name in enumerate(_MONTH_ABBREVIATIONS, 1)},
+    **{name: number for number, name in enumerate(_MONTH_NAMES, 1)}
+}
+
+# strptime's own sub-patterns for the directives parse_date uses, so the compiled formats accept exactly the same strings
+_DATE_DIRECTIVES = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "y": r"(?P<y>\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "b": "(?P<b>" + "|".join(sorted(_MONTH_ABBREVIATIONS, key=len, reverse=True)) + ")",
+    "B": "(?P<B>" + "|".join(sorted(_MONTH_NAMES, key=len, reverse=True)) + ")",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+}
+
+
+def _compile_date_format(fmt: str) -> "re.Pattern":
+    """Compile a strptime format into the equivalent case-insensitive regex."""
+    pattern = "".join(
+        _DATE_DIRECTIVES[part[1]] if part.startswith("%") else r"\s+".join(map(re.escape, re.split(r"\s+", part)))
+        for part in re.split(r"(%\w)", fmt)
+    )
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Supported date formats in the order they are tried
+_DATE_FORMATS = tuple(map(_compile_date_format, (
+    "%Y-%m-%d %H:%M:%S",  # 2025-11-06 00:00:00
+    "%Y-%m-%d",           # 2025-11-06 (ISO format)
+    "%d-%b-%y",           # 06-Nov-25 (primary format)
+    "%d-%B-%y",           # 06-November-25 (full month name)
+    "%d-%b-%Y",           # 06-Nov-2025 (4-digit year)
+    "%d-%B-%Y",           # 06-November-2025
+    "%d/%b/%y",           # 06/Nov/25
+    "%d/%B/%y",           # 06/November/25
+    "%d/%b/%Y",           # 06/Nov/2025
+    "%d/%B/%Y",           # 06/November/2025
+    "%d.%b.%y",           # 06.Nov.25
+    "%d.%B.%y",           # 06.November.25
+    "%d-%m-%Y",           # 06-11-2025
+    "%d/%m/%Y",           # 06/11/2025
+    "%d-%m-%y",           # 06-11-25
+    "%d/%m/%y",           # 06/11/25
+    "%m/%d/%Y",           # 11/06/2025 (US format)
+    "%m-%d-%Y",           # 11-06-2025 (US format)
+    "%m/%d/%y",           # 11/06/25 (US format)
+    "%m-%d-%y",           # 11-06-25 (US format)
+)))
+_ISO_DATE_FORMAT = _DATE_FORMATS[1]
+
+
+def _date_from_match(match: "re.Match") -> Optional[date]:
+    """Build the date a compiled format matched, or None when strptime would reject the values."""
+    fields = match.groupdict()
+    if fields.get("Y") is not None:
+        year = int(fields["Y"])
+    else:
+        # strptime's %y pivot: 00-68 are 2000s, 69-99 are 1900s
+        year = int(fields["y"])
+        year += 2000 if year <= 68 else 1900
+    if fields.get("m") is not None:
+        month = int(fields["m"])
+    else:
+        # Case-insensitive matching also admits look-alikes such as "ſ" that are not real month names
+        month = _MONTH_NUMBERS.get((fields.get("b") or fields["B"]).lower())
+        if month is None:
+            return None
+    
+    try:
+        if fields.get("H") is not None:
+            time(int(fields["H"]), int(fields["M"]), int(fields["S"]))
+        return date(year, month, int(fields["d"]))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(date_str: str) -> Optional[date]:
+    """Parse a stripped date string with the supported formats; None when nothing matches."""
+    # Handle datetime strings first (most common from Excel exports)
+    if ' ' in date_str and ':' in date_str:
+        match = _ISO_DATE_FORMAT.fullmatch(date_str.split(' ')[0])
+        parsed_date = _date_from_match(match) if match else None
+        if parsed_date:
+            return parsed_date
+    
+    # Try the supported formats in order; a failed regex match is far cheaper than a failed strptime
+    for date_format in _DATE_FORMATS:
+        match = date_format.fullmatch(date_str)
+        parsed_date = _date_from_match(match) if match else None
+        if parsed_date:
+            return parsed_date
+    
+    # Try Excel serial date numbers
+    try:
+        if str(date_str).replace('.', '').replace('-', '').isdigit():
+            excel_date = float(date_str)
+            if excel_date > 59:
+                excel_date -= 1
+            base_date = datetime(1900, 1, 1)
+            from datetime import timedelta
+            parsed_date = base_date + timedelta(days=excel_date-1)
+            return parsed_date.date()
+    except (ValueError, OverflowError):
+        pass
+    
+    return None
+
+
+# One row per lead, one column per worksheet header (plus _row_number and _sheet_name)
+RecordSet = pd.DataFrame
+
+
+class PreparedData(NamedTuple):
+    """Result of DataProcessor.prepare: cleaned records plus the outcome of each check."""
+    records: RecordSet
+    validation_errors: Dict[str, str]
+    optional_columns: Dict[str, bool]
+
 
 class DataProcessor:
     """Handles data processing and validation logic with date support."""
     
+    # Column clean_data adds with the normalized Lead Status, so later counts skip re-normalizing
+    _NORMALIZED_LEAD_STATUS = '_lead_status_normalized'
+    # Metadata and system columns that can never hold the audit date
+    _EXCLUDED_DATE_OPTIONS = frozenset({'_row_number', '_sheet_name', _NORMALIZED_LEAD_STATUS, 'lead status', 'dq reason', 'agent name'})
+    # Header words that suggest a column holds dates
+    _DATE_TOKENS = frozenset({'date', 'dt', 'audit', 'day', 'time', 'timestamp'})
+    
     def __init__(self, config: Config):
         self.config = config
         self.date_column = None
         self.parsed_dates = {}
+        self._date_series_cache = None
     
     @staticmethod
     def normalize(value: Any) -> str:
         """Normalize values for comparison."""
+        if isinstance(value, str):
+            return _normalize_text(value)
         return str(value).strip().lower() if value is not None else ""
     
+    @staticmethod
+    def get_column(records: RecordSet, column: str, default: Any = None) -> pd.Series:
+        """Return a column of the records, or a Series of default when the column is absent."""
+        if column in records.columns:
+            return records[column]
+        return pd.Series(default, index=records.index, dtype=object)
+    
+    @staticmethod
+    def factorize(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        pd.factorize that also tells apart equal values of different types.
+        
+        pd.factorize gives True, 1 and 1.0 one code, so a per-value result would be
+        broadcast to all of them. Columns holding a single kind of value cannot collide
+        and keep the plain factorize; mixed columns are split by (value, type).
+        Missing cells get code -1.
+        """
+        codes, uniques = pd.factorize(values)
+        if pd.api.types.infer_dtype(values, skipna=True) not in _MIXED_DTYPES:
+            return codes, uniques
+        
+        type_codes, types = pd.factorize(values.map(type, na_action="ignore"))
+        
+        # Float keys keep NaN as the missing marker, so factorize leaves missing cells at -1
+        keys = np.where(codes >= 0, codes * len(types) + type_codes, np.nan)
+        codes, _ = pd.factorize(keys)
+        
+        # Each (value, type) key is represented by the row where it first appears
+        key_codes, first_rows = np.unique(codes, return_index=True)
+        uniques = values.to_numpy(dtype=object)[first_rows[key_codes >= 0]]
+        return codes, uniques
+    
+    @classmethod
+    def map_unique(cls, values: pd.Series, func: Callable[[Any], Any], missing: Any = None) -> pd.Series:
+        """
+        Apply func once per distinct value and broadcast the results back to every row.
+        Missing cells (None/NaN) get the missing value without calling func.
+        """
+        codes, uniques = cls.factorize(values)
+        mapped = np.empty(len(uniques) + 1, dtype=object)
+        mapped[:-1] = [func(value) for value in uniques]
+        mapped[-1] = missing
+        return pd.Series(mapped.take(codes), index=values.index, dtype=object)
+    
+    @classmethod
+    def normalize_series(cls, values: pd.Series) -> pd.Series:
+        """Normalize a column of values for comparison."""
+        return cls.map_unique(values, cls.normalize, "")
+    
+    @classmethod
+    def normalized_lead_status(cls, records: RecordSet) -> pd.Series:
+        """Normalized Lead Status column, reusing the one clean_data precomputes when present."""
+        if cls._NORMALIZED_LEAD_STATUS in records.columns:
+            return records[cls._NORMALIZED_LEAD_STATUS]
+        return cls.normalize_series(cls.get_column(records, "Lead Status", ""))
+    
+    @classmethod
+    def lead_status_counts(cls, records: RecordSet) -> pd.Series:
+        """
+        Count each raw Lead Status value in order of first appearance (missing cells are skipped).
+        Computed once, the counts can be shared by DataValidator.find_lead_status_issues
+        and validate_lead_status instead of each rescanning the rows.
+        """
+        return cls.get_column(records, "Lead Status").value_counts(sort=False)
+    
     def validate_file_size(self, uploaded_file) -> None:
         """Validate file size."""
-        if hasattr(uploaded_file, 'size') and uploaded_file.size > self.config.MAX_FILE_SIZE_MB * 1024 * 1024:
+        # Read once: a network file's size comes from the share at the time it is asked for
+        file_size = getattr(uploaded_file, 'size', None)
+        if file_size is not None and file_size > self.config.MAX_FILE_SIZE_MB * 1024 * 1024:
             raise ValidationError(f"File size exceeds {self.config.MAX_FILE_SIZE_MB} MB limit")
     
-    def load_and_parse_excel(self, uploaded_file) -> Tuple[List[str], List[Dict[str, Any]]]:
+    def load_and_parse_excel(self, uploaded_file) -> Tuple[List[str], RecordSet]:
         """Load and parse Excel file from two sheets: Qualified and Disqualified."""
         try:
             self.validate_file_size(uploaded_file)
             
-            wb = load_workbook(uploaded_file, read_only=True, data_only=True)
-            if not wb.worksheets:
-                raise ValidationError("No worksheets found in the file")
-            
-            # Find Qualified and Disqualified sheets (case-insensitive)
-            qualified_sheet = None
-            disqualified_sheet = None
-            
-            for sheet in wb.worksheets:
-                sheet_name_lower = sheet.title.lower().strip()
-                if sheet_name_lower == "qualified":
-                    qualified_sheet = sheet
-                elif sheet_name_lower == "disqualified":
-                    disqualified_sheet = sheet
-            
-            # Check if at least one sheet exists
-            if qualified_sheet is None and disqualified_sheet is None:
-                raise ValidationError(
-                    'Required sheets not found. File must contain at least one sheet named "Qualified" or "Disqualified" (case-insensitive)'
-                )
-            
-            all_records = []
-            all_headers = []
+            with pd.ExcelFile(uploaded_file, engine=EXCEL_ENGINE) as excel_file:
+                if not excel_file.sheet_names:
+                    raise ValidationError("No worksheets found in the file")
+                
+                # Find Qualified and Disqualified sheets (case-insensitive)
+                qualified_sheet = None
+                disqualified_sheet = None
+                
+                for sheet_name in excel_file.sheet_names:
+                    sheet_name_lower = sheet_name.lower().strip()
+                    if sheet_name_lower == "qualified":
+                        qualified_sheet = sheet_name
+                    elif sheet_name_lower == "disqualified":
+                        disqualified_sheet = sheet_name
+                
+                # Check if at least one sheet exists
+                if qualified_sheet is None and disqualified_sheet is None:
+                    raise ValidationError(
+                        'Required sheets not found. File must contain at least one sheet named "Qualified" or "Disqualified" (case-insensitive)'
+                    )
+                
+                frames = []
+                all_headers = []
+                
+                # Process Qualified sheet if it exists
+                if qualified_sheet is not None:
+                    logger.debug(f"Processing 'Qualified' sheet: {qualified_sheet}")
+                    headers, frame = self._parse_sheet(excel_file, qualified_sheet, "Qualified")
+                    all_headers.extend(headers)
+                    frames.append(frame)
+                    logger.debug(f"Loaded {len(frame)} records from Qualified sheet")
+                else:
+                    logger.warning("'Qualified' sheet not found, proceeding without it")
+                
+                # Process Disqualified sheet if it exists
+                if disqualified_sheet is not None:
+                    logger.debug(f"Processing 'Disqualified' sheet: {disqualified_sheet}")
+                    headers, frame = self._parse_sheet(excel_file, disqualified_sheet, "Disqualified")
+                    all_headers.extend(headers)
+                    frames.append(frame)
+                    logger.debug(f"Loaded {len(frame)} records from Disqualified sheet")
+                else:
+                    logger.warning("'Disqualified' sheet not found, proceeding without it")
             
-            # Process Qualified sheet if it exists
-            if qualified_sheet is not None:
-                logger.debug(f"Processing 'Qualified' sheet: {qualified_sheet.title}")
-                headers, records = self._parse_sheet(qualified_sheet, "Qualified")
-                all_headers.extend(headers)
-                all_records.extend(records)
-                logger.debug(f"Loaded {len(records)} records from Qualified sheet")
-            else:
-                logger.warning("'Qualified' sheet not found, proceeding without it")
+            frames = [frame for frame in frames if not frame.empty]
+            if not frames:
+                raise ValidationError("No valid data records found in any sheet")
             
-            # Process Disqualified sheet if it exists
-            if disqualified_sheet is not None:
-                logger.debug(f"Processing 'Disqualified' sheet: {disqualified_sheet.title}")
-                headers, records = self._parse_sheet(disqualified_sheet, "Disqualified")
-                all_headers.extend(headers)
-                all_records.extend(records)
-                logger.debug(f"Loaded {len(records)} records from Disqualified sheet")
-            else:
-                logger.warning("'Disqualified' sheet not found, proceeding without it")
+            # Combine all unique headers from both sheets; the first spelling of a case-insensitive duplicate wins
+            header_index = pd.Index(all_headers, dtype=object)
+            unique_headers = header_index[~header_index.str.lower().duplicated()].tolist()
             
-            if not all_records:
-                raise ValidationError("No valid data records found in any sheet")
+            combined = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
             
-            # Combine all unique headers from both sheets
-            unique_headers = []
-            seen_headers = set()
-            for header in all_headers:
-                header_lower = header.lower()
-                if header_lower not in seen_headers:
-                    unique_headers.append(header)
-                    seen_headers.add(header_lower)
+            # Empty sheet cells become None; the metadata columns keep compact int64/category dtypes
+            cell_columns = [column for column in combined.columns if column not in ("_row_number", "_sheet_name")]
+            cells = combined[cell_columns].astype(object)
+            all_records = combined.assign(**{
+                column: cells[column].where(cells[column].notna(), None) for column in cell_columns
+            })
+            all_records["_sheet_name"] = all_records["_sheet_name"].astype("category")
             
             logger.debug(f"Successfully loaded {len(all_records)} total records from both sheets")
             return unique_headers, all_records
@@ -105,43 +387,53 @@ class DataProcessor:
             logger.error(f"Error loading Excel file: {str(e)}")
             raise ValidationError(f"Error reading file: {str(e)}")
     
-    def _parse_sheet(self, worksheet, sheet_type: str) -> Tuple[List[str], List[Dict[str, Any]]]:
-        """Parse a single worksheet and return headers and records."""
-        if worksheet.max_row < 2:
+    def _read_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """Read a worksheet as a raw grid of cells, header row included."""
+        if EXCEL_ENGINE == "calamine":
+            # Take the cell grid straight from the open calamine workbook, skipping pandas' row-by-row text parser
+            rows = excel_file.book.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+            data = pd.DataFrame(rows, dtype=object)
+            # map_unique converts once per (value, type), so TRUE and 1 cells in one column stay a bool and an int
+            return data.apply(lambda column: self.map_unique(column.mask(column.eq("")), _convert_calamine_cell))
+        
+        # Read the whole sheet in one call; only empty cells become missing values
+        return excel_file.parse(
+            sheet_name, header=None, dtype=object, keep_default_na=False, na_values=[""]
+        )
+    
+    def _parse_sheet(self, excel_file: pd.ExcelFile, sheet_name: str, sheet_type: str) -> Tuple[List[str], pd.DataFrame]:
+        """Parse a single worksheet and return headers and a DataFrame of records."""
+        data = self._read_sheet(excel_file, sheet_name)
+        
+        if len(data) < 2:
             logger.warning(f"{sheet_type} sheet contains no data rows")
-            return [], []
+            return [], pd.DataFrame()
         
-        # Extract data from worksheet
-        data = []
-        for row in worksheet.iter_rows(values_only=True):
-            if any(cell is not None for cell in row):  # Skip completely empty rows
-                data.append(row)
+        # Skip completely empty rows
+        data = data.dropna(how="all")
         
-        if not data:
+        if data.empty:
             logger.warning(f"No valid data found in {sheet_type} sheet")
-            return [], []
+            return [], pd.DataFrame()
         
         # Extract headers
-        headers = [str(h).strip() if h is not None else f"Column_{i+1}" for i, h in enumerate(data[0])]
+        headers = [
+            str(h).strip() if not pd.isna(h) else f"Column_{i+1}"
+            for i, h in enumerate(data.iloc[0])
+        ]
         
-        # Create records
-        records = []
-        for row_idx, row in enumerate(data[1:], start=2):
-            if not any(cell is not None for cell in row):  # Skip empty rows
-                continue
-            
-            record = {}
-            for i, header in enumerate(headers):
-                value = row[i] if i < len(row) else None
-                record[header] = value
-            
-            # Add metadata
-            record['_row_number'] = row_idx
-            record['_sheet_name'] = sheet_type
-            
-            records.append(record)
+        # Create records (a repeated header keeps its last column, as a dict would); under
+        # copy-on-write the data rows stay shared with the grid until something writes to them
+        frame = data.iloc[1:]
+        frame.columns = headers
+        frame = frame.loc[:, ~frame.columns.duplicated(keep="last")]
         
-        return headers, records
+        # Add metadata
+        frame['_row_number'] = range(2, len(frame) + 2)
+        frame['_sheet_name'] = sheet_type
+        frame = frame.reset_index(drop=True)
+        
+        return headers, frame
     
     def detect_date_column(self, headers: List[str]) -> Optional[str]:
         """Detect if Audit Date column exists, return column name or None."""
@@ -156,11 +448,12 @@ class DataProcessor:
         return None
     
     def get_date_column_options(self, headers: List[str]) -> List[str]:
-        """Get potential date column options from headers."""
+        """Get potential date column options from headers, date-like names first."""
         # Filter out metadata columns and system columns
-        excluded_lower = ['_row_number', '_sheet_name', 'lead status', 'dq reason', 'agent name']
+        options = [h for h in headers if h.lower() not in self._EXCLUDED_DATE_OPTIONS]
         
-        options = [h for h in headers if h.lower() not in excluded_lower]
+        # Stable sort: headers containing a date word move to the front, original order otherwise kept
+        options.sort(key=lambda h: self._DATE_TOKENS.isdisjoint(re.split(r"[\W_]+", h.lower())))
         return options
     
     def parse_date(self, date_value: Any) -> Optional[date]:
@@ -179,74 +472,22 @@ class DataProcessor:
         
         date_str = str(date_value).strip()
         
-        # Handle datetime strings first (most common from Excel exports)
-        if ' ' in date_str and ':' in date_str:
-            try:
-                date_part = date_str.split(' ')[0]
-                return datetime.strptime(date_part, "%Y-%m-%d").date()
-            except:
-                pass
-        
-        # Try multiple date formats
-        date_formats = [
-            "%Y-%m-%d %H:%M:%S",  # 2025-11-06 00:00:00
-            "%Y-%m-%d",           # 2025-11-06 (ISO format)
-            "%d-%b-%y",           # 06-Nov-25 (primary format)
-            "%d-%B-%y",           # 06-November-25 (full month name)
-            "%d-%b-%Y",           # 06-Nov-2025 (4-digit year)
-            "%d-%B-%Y",           # 06-November-2025
-            "%d/%b/%y",           # 06/Nov/25
-            "%d/%B/%y",           # 06/November/25
-            "%d/%b/%Y",           # 06/Nov/2025
-            "%d/%B/%Y",           # 06/November/2025
-            "%d.%b.%y",           # 06.Nov.25
-            "%d.%B.%y",           # 06.November.25
-            "%d-%m-%Y",           # 06-11-2025
-            "%d/%m/%Y",           # 06/11/2025
-            "%d-%m-%y",           # 06-11-25
-            "%d/%m/%y",           # 06/11/25
-            "%m/%d/%Y",           # 11/06/2025 (US format)
-            "%m-%d-%Y",           # 11-06-2025 (US format)
-            "%m/%d/%y",           # 11/06/25 (US format)
-            "%m-%d-%y",           # 11-06-25 (US format)
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt).date()
-                return parsed_date
-            except ValueError:
-                continue
-        
-        # Try Excel serial date numbers
-        try:
-            if str(date_str).replace('.', '').replace('-', '').isdigit():
-                excel_date = float(date_str)
-                if excel_date > 59:
-                    excel_date -= 1
-                base_date = datetime(1900, 1, 1)
-                from datetime import timedelta
-                parsed_date = base_date + timedelta(days=excel_date-1)
-                return parsed_date.date()
-        except (ValueError, OverflowError):
-            pass
-        
-        logger.warning(f"Could not parse date: '{date_str}'")
-        return None
+        # Repeated strings (every row of one audit day) are answered from the cache
+        parsed_date = _parse_date_text(date_str)
+        if parsed_date is None:
+            logger.warning(f"Could not parse date: '{date_str}'")
+        return parsed_date
     
-    def parse_dates_from_records(self, records: List[Dict[str, Any]], date_column: str) -> Dict[int, date]:
-        """Parse dates from all records and return mapping of record index to parsed date."""
-        parsed_dates = {}
-        parse_errors = 0
-        
-        for idx, record in enumerate(records):
-            date_value = record.get(date_column)
-            parsed_date = self.parse_date(date_value)
-            if parsed_date:
-                parsed_dates[idx] = parsed_date
-            else:
-                if date_value is not None and str(date_value).strip() not in ['', 'nan', 'NaN']:
-                    parse_errors += 1
+    def parse_dates_from_records(self, records: RecordSet, date_column: str) -> Dict[int, date]:
+        """Parse dates from all records and return mapping of record position to parsed date."""
+        dates = self.get_date_series(records, date_column)
+        valid = dates.notna().to_numpy()
+        
+        parsed_dates = dict(zip(np.flatnonzero(valid).tolist(), dates[valid].dt.date))
+        parse_errors = sum(
+            1 for value in self.get_column(records, date_column)[~valid]
+            if value is not None and str(value).strip() not in ['', 'nan', 'NaN']
+        )
         
         self.parsed_dates = parsed_dates
         logger.info(f"Successfully parsed {len(parsed_dates)} dates out of {len(records)} records (Errors: {parse_errors})")
@@ -257,91 +498,180 @@ class DataProcessor:
         if not self.parsed_dates:
             return []
         
-        unique_dates = sorted(set(self.parsed_dates.values()))
+        # Deduplicate and sort as 8-byte day numbers instead of hashing date objects
+        days = np.fromiter(self.parsed_dates.values(), dtype="datetime64[D]", count=len(self.parsed_dates))
+        unique_dates = np.unique(days).tolist()
         return unique_dates
     
-    def filter_records_by_date(self, records: List[Dict[str, Any]], target_date: date) -> List[Dict[str, Any]]:
+    def get_date_series(self, records: RecordSet, date_column: str) -> pd.Series:
+        """
+        Parse the date column once per record set and return it as a datetime Series.
+        Unparseable values become NaT, so comparisons against them are always False.
+        """
+        cached = self._date_series_cache
+        if cached is not None and cached[0] is records and cached[1] == date_column:
+            return cached[2]
+        
+        values = self.get_column(records, date_column)
+        
+        # Audit dates repeat heavily, so parse once per distinct value
+        codes, uniques = self.factorize(values)
+        parsed = self._parse_unique_dates(uniques)
+        
+        # Missing values get code -1, which picks the trailing NaT
+        parsed = np.append(parsed, np.array(["NaT"], dtype=parsed.dtype))
+        dates = pd.Series(parsed.take(codes), index=records.index)
+        
+        # Keep a reference to the records so the identity check cannot match a recycled id
+        self._date_series_cache = (records, date_column, dates)
+        return dates
+    
+    def _parse_unique_dates(self, uniques) -> np.ndarray:
+        """Parse distinct date values into a datetime64 array, NaT where a value cannot be parsed."""
+        # Excel date cells arrive as naive datetimes (often with distinct times); truncate them to days in one vectorized pass
+        if len(uniques) and pd.api.types.infer_dtype(uniques, skipna=False) == "datetime":
+            try:
+                stamps = pd.DatetimeIndex(uniques)
+            except (TypeError, ValueError):
+                stamps = None
+            if stamps is not None and stamps.tz is None:
+                return stamps.normalize().as_unit("s").to_numpy()
+        
+        values = np.asarray(uniques, dtype=object)
+        parsed = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[s]")
+        
+        # Numeric cells holding Excel serial day numbers (often fractional, so mostly distinct) convert in one pass
+        serials = np.fromiter((_excel_serial(value) for value in values), dtype=float, count=len(values))
+        is_serial = ~np.isnan(serials)
+        if is_serial.any():
+            parsed[is_serial] = _excel_serials_to_dates(serials[is_serial])
+            for value in values[is_serial][np.isnat(parsed[is_serial])]:
+                logger.warning(f"Could not parse date: '{str(value).strip()}'")
+        
+        # Text and other values go through parse_date's format cascade
+        is_other = ~is_serial
+        if is_other.any():
+            parsed[is_other] = pd.to_datetime(pd.Series(values[is_other], dtype=object).map(self.parse_date), errors="coerce").to_numpy()
+        return parsed
+    
+    def restore_date_series(self, records: RecordSet, date_column: str, dates: pd.Series) -> None:
+        """Reuse a date Series returned by get_date_series for the same records and column."""
+        self._date_series_cache = (records, date_column, dates)
+    
+    def filter_records_by_date(self, records: RecordSet, target_date: date) -> RecordSet:
         """Filter records to only those matching the target date."""
         if not self.date_column:
             logger.error("No date column set for filtering")
-            return []
+            return records.iloc[:0]
         
-        filtered = []
-        
-        for record in records:
-            date_value = record.get(self.date_column)
-            parsed_date = self.parse_date(date_value)
-            
-            if parsed_date and parsed_date == target_date:
-                filtered.append(record)
+        dates = self.get_date_series(records, self.date_column)
+        filtered = records[dates.eq(pd.Timestamp(target_date)).to_numpy()]
         
         logger.info(f"Filtered {len(filtered)} records for date {target_date}")
         return filtered
     
-    def filter_records_mtd(self, records: List[Dict[str, Any]], selected_date: date) -> List[Dict[str, Any]]:
+    def filter_records_mtd(self, records: RecordSet, selected_date: date) -> RecordSet:
         """
         Filter records for Month-To-Date (from earliest date in dataset to selected date).
         MTD starts from the 1st day of the earliest month with data.
         """
         if not self.date_column:
             logger.error("No date column set for filtering")
-            return []
+            return records.iloc[:0]
         
         # Find the earliest date in the dataset
-        earliest_date = None
-        for record in records:
-            date_value = record.get(self.date_column)
-            parsed_date = self.parse_date(date_value)
-            if parsed_date:
-                if earliest_date is None or parsed_date < earliest_date:
-                    earliest_date = parsed_date
-        
-        if earliest_date is None:
+        dates = self.get_date_series(records, self.date_column)
+        earliest_date = dates.min()
+        
+        if pd.isna(earliest_date):
             logger.warning("No valid dates found in dataset for MTD calculation")
-            return []
+            return records.iloc[:0]
         
         # Get the 1st day of the earliest month
         mtd_start = date(earliest_date.year, earliest_date.month, 1)
         
-        filtered = []
-        
-        for record in records:
-            date_value = record.get(self.date_column)
-            parsed_date = self.parse_date(date_value)
-            
-            if parsed_date and mtd_start <= parsed_date <= selected_date:
-                filtered.append(record)
+        mask = dates.between(pd.Timestamp(mtd_start), pd.Timestamp(selected_date))
+        filtered = records[mask.to_numpy()]
         
         logger.info(f"MTD Filtering: Start={mtd_start} (earliest month), End={selected_date}, Filtered {len(filtered)} records out of {len(records)} total")
         return filtered
     
+    def partition_by_date(self, records: RecordSet, selected_date: date) -> Tuple[RecordSet, RecordSet]:
+        """
+        Split records into the selected date's rows and the Month-To-Date rows in one pass.
+        Same results as filter_records_by_date and filter_records_mtd, from a single date Series.
+        """
+        if not self.date_column:
+            logger.error("No date column set for filtering")
+            return records.iloc[:0], records.iloc[:0]
+        
+        dates = self.get_date_series(records, self.date_column)
+        earliest_date = dates.min()
+        
+        # Compare as datetime64 day numbers; NaT never matches either mask
+        days = dates.to_numpy().astype("datetime64[D]")
+        selected_day = np.datetime64(selected_date, "D")
+        date_records = records[days == selected_day]
+        
+        if pd.isna(earliest_date):
+            logger.warning("No valid dates found in dataset for MTD calculation")
+            return date_records, records.iloc[:0]
+        
+        mtd_start = date(earliest_date.year, earliest_date.month, 1)
+        mtd_records = records[(days >= np.datetime64(mtd_start, "D")) & (days <= selected_day)]
+        
+        logger.info(f"Filtered {len(date_records)} records for date {selected_date}; MTD {mtd_start} to {selected_date}: {len(mtd_records)} of {len(records)}")
+        return date_records, mtd_records
+    
     def validate_columns(self, headers: List[str]) -> None:
         """Validate required columns are present."""
-        headers_lower = [h.lower() for h in headers]
+        headers_lower = _lowercase_headers(tuple(headers))
         missing_cols = [
-            col for col in self.config.REQUIRED_COLUMNS 
-            if col.lower() not in headers_lower
+            col for col, col_lower in zip(self.config.REQUIRED_COLUMNS, self.config.REQUIRED_COLUMNS_LOWER)
+            if col_lower not in headers_lower
         ]
         
         if missing_cols:
             raise ValidationError(f"Missing required columns: {', '.join(missing_cols)}")
     
-    def validate_lead_status(self, records: List[Dict[str, Any]]) -> None:
-        """Validate lead status values."""
-        unique_statuses = set(
-            self.normalize(r.get("Lead Status"))
-            for r in records 
-            if r.get("Lead Status") is not None
-        )
-        
-        accepted_statuses = [self.normalize(status) for status in self.config.ACCEPTED_LEAD_STATUS]
-        unexpected_statuses = [status for status in unique_statuses if status and status not in accepted_statuses]
+    def validate_lead_status(self, records: RecordSet, status_counts: Optional[pd.Series] = None) -> None:
+        """
+        Validate lead status values.
+        Precomputed lead_status_counts can be passed to check the distinct values without rescanning the rows.
+        """
+        if status_counts is None:
+            status_counts = self.lead_status_counts(records)
+        normalize = self.normalize
+        unexpected_statuses = self._unexpected_statuses(normalize(status) for status in status_counts.index)
         
         if unexpected_statuses:
-            raise ValidationError(
-                f"Invalid Lead Status values: {', '.join(unexpected_statuses)}. "
-                f"Allowed values: {', '.join(self.config.ACCEPTED_LEAD_STATUS)}"
-            )
+            raise ValidationError(self._invalid_lead_status_message(unexpected_statuses))
+    
+    def _scan_lead_status(self, records: RecordSet) -> Tuple[List[str], np.ndarray]:
+        """
+        Factorize Lead Status once and return the normalized values that are not accepted,
+        together with the mask of disqualified rows.
+        """
+        codes, uniques = self.factorize(self.get_column(records, "Lead Status"))
+        normalize = self.normalize
+        normalized = [normalize(status) for status in uniques]
+        
+        # Missing values get code -1, which picks the trailing False
+        is_disqualified = np.array([status == "disqualified" for status in normalized] + [False], dtype=bool)
+        return self._unexpected_statuses(normalized), is_disqualified.take(codes)
+    
+    def _unexpected_statuses(self, normalized_statuses) -> List[str]:
+        """Distinct normalized Lead Status values that are neither blank nor accepted."""
+        unique_statuses = set(normalized_statuses)
+        accepted_statuses = self.config.ACCEPTED_LEAD_STATUS_SET
+        return [status for status in unique_statuses if status and status not in accepted_statuses]
+    
+    def _invalid_lead_status_message(self, unexpected_statuses) -> str:
+        """Build the error message listing unexpected Lead Status values."""
+        return (
+            f"Invalid Lead Status values: {', '.join(unexpected_statuses)}. "
+            f"Allowed values: {', '.join(self.config.ACCEPTED_LEAD_STATUS)}"
+        )
     
     def normalize_dq_reason(self, dq_reason: str) -> str:
         """
@@ -364,60 +694,97 @@ class DataProcessor:
         clean_reason = str(dq_reason).strip()
         return clean_reason.title()
     
-    def validate_dq_reasons(self, records: List[Dict[str, Any]]) -> None:
+    def validate_dq_reasons(self, records: RecordSet, disqualified: Optional[np.ndarray] = None) -> None:
         """
         Normalize DQ reason values for disqualified leads.
         Accepts all DQ reasons but standardizes known variations.
         This is now a normalization step rather than strict validation.
+        A precomputed disqualified-row mask can be passed to skip rescanning Lead Status.
         """
         # No strict validation - just log unique DQ reasons for informational purposes
-        unique_reasons = set()
-        for record in records:
-            lead_status = self.normalize(record.get("Lead Status"))
-            
-            if lead_status == "disqualified":
-                dq_reason = record.get("DQ Reason")
-                if dq_reason is not None:
-                    clean_reason = str(dq_reason).strip()
-                    if clean_reason and clean_reason != "-":
-                        unique_reasons.add(clean_reason)
+        unique_reasons = self._find_unique_dq_reasons(records, disqualified)
         
         if unique_reasons:
             logger.info(f"Found {len(unique_reasons)} unique DQ Reason values in dataset")
         
         # No ValidationError raised - all DQ reasons are accepted
     
+    def _find_unique_dq_reasons(self, records: RecordSet, disqualified: Optional[np.ndarray] = None) -> set:
+        """Return the distinct non-blank DQ Reason values of disqualified leads."""
+        if disqualified is None:
+            _, disqualified = self._scan_lead_status(records)
+        dq_reasons = self.get_column(records, "DQ Reason")[disqualified].dropna().unique()
+        return {str(dq_reason).strip() for dq_reason in dq_reasons} - {"", "-"}
+    
     def check_optional_columns(self, headers: List[str]) -> Dict[str, bool]:
         """Check which optional columns are available in the data."""
-        headers_lower = [h.lower() for h in headers]
+        headers_lower = _lowercase_headers(tuple(headers))
         optional_availability = {}
         
-        for col in self.config.OPTIONAL_COLUMNS:
-            optional_availability[col] = col.lower() in headers_lower
+        for col, col_lower in zip(self.config.OPTIONAL_COLUMNS, self.config.OPTIONAL_COLUMNS_LOWER):
+            optional_availability[col] = col_lower in headers_lower
         
         return optional_availability
     
-    def clean_data(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def clean_data(self, records: RecordSet) -> RecordSet:
         """Clean and standardize data with DQ Reason normalization."""
-        cleaned_records = []
+        cleaned_columns = {}
+        
+        # Clean key fields
+        for field in ["Lead Status", "Agent Name", "DQ Reason"]:
+            # For Lead Status, keep empty if missing; for others use (Blank)
+            blank_value = "" if field == "Lead Status" else "(Blank)"
+            if field in records.columns:
+                clean_value = partial(self._clean_value, field, blank_value)
+                cleaned_columns[field] = self.map_unique(records[field], clean_value, blank_value)
+            else:
+                cleaned_columns[field] = blank_value
         
-        for record in records:
-            cleaned_record = record.copy()
-            
-            # Clean key fields
-            for field in ["Lead Status", "Agent Name", "DQ Reason"]:
-                value = cleaned_record.get(field)
-                if value is None or str(value).strip() == "" or str(value).strip() == "-":
-                    # For Lead Status, keep empty if missing; for others use (Blank)
-                    cleaned_record[field] = "" if field == "Lead Status" else "(Blank)"
-                else:
-                    cleaned_value = str(value).strip()
-                    # Normalize DQ Reason to standardize variations
-                    if field == "DQ Reason":
-                        cleaned_record[field] = self.normalize_dq_reason(cleaned_value)
-                    else:
-                        cleaned_record[field] = cleaned_value
-            
-            cleaned_records.append(cleaned_record)
+        # Normalize the cleaned Lead Status once for every report and summary count
+        lead_status = cleaned_columns["Lead Status"]
+        cleaned_columns[self._NORMALIZED_LEAD_STATUS] = self.normalize_series(lead_status) if isinstance(lead_status, pd.Series) else ""
+        
+        # Untouched columns are shared with the input rather than copied
+        return records.assign(**cleaned_columns)
+    
+    def _clean_value(self, field: str, blank_value: str, value: Any) -> str:
+        """Clean a single key-field value."""
+        if value is None or str(value).strip() == "" or str(value).strip() == "-":
+            return blank_value
+        
+        cleaned_value = str(value).strip()
+        # Normalize DQ Reason to standardize variations
+        if field == "DQ Reason":
+            return self.normalize_dq_reason(cleaned_value)
+        return cleaned_value
+    
+    def prepare(self, headers: List[str], records: RecordSet) -> PreparedData:
+        """
+        Validate, clean and inspect the data in one call.
+        
+        Combines validate_columns, validate_lead_status, validate_dq_reasons,
+        clean_data and check_optional_columns. Validation problems are returned
+        keyed by check ("columns", "lead_status") instead of being raised, so the
+        caller can report every check in order.
+        
+        Args:
+            headers: Column headers from the workbook
+            records: Records to validate and clean
+        
+        Returns:
+            PreparedData with cleaned records, validation errors and optional column availability
+        """
+        validation_errors = {}
+        try:
+            self.validate_columns(headers)
+        except ValidationError as e:
+            validation_errors["columns"] = str(e)
+        
+        # One Lead Status scan serves both the status check and the DQ reason check
+        unexpected_statuses, disqualified = self._scan_lead_status(records)
+        if unexpected_statuses:
+            validation_errors["lead_status"] = self._invalid_lead_status_message(unexpected_statuses)
+        
+        self.validate_dq_reasons(records, disqualified)
         
-        return cleaned_records
+        return PreparedData(self.clean_data(records), validation_errors, self.check_optional_columns(headers))
\ No newline at end of file
@@ -6,7 +6,11 @@ Provides intelligent Lead Status validation with fuzzy matching and correction s
 import logging
 from typing import Dict, List, Tuple, Any, Optional
 from difflib import get_close_matches
-from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .data_processor import DataProcessor, RecordSet
 
 logger = logging.getLogger(__name__)
 
@@ -50,24 +54,23 @@ class DataValidator:
         
         return status_text
     
-    def find_lead_status_issues(self, records: List[Dict[str, Any]]) -> Tuple[List[Dict], Dict[str, str]]:
+    def find_lead_status_issues(self, records: RecordSet, status_counts: Optional[pd.Series] = None) -> Tuple[List[Dict], Dict[str, str]]:
         """
         Find invalid Lead Status values and suggest corrections.
         
         Args:
-            records: List of data records
+            records: Data records
+            status_counts: Precomputed DataProcessor.lead_status_counts of the records (computed when omitted)
             
         Returns:
             Tuple of (issues_list, auto_suggestions_dict)
         """
         valid_statuses = set(self.config.ACCEPTED_LEAD_STATUS)
-        status_counts = Counter()
+        valid_options = list(valid_statuses)
         
-        # Count all unique Lead Status values
-        for record in records:
-            status = record.get('Lead Status')
-            if status is not None:
-                status_counts[status] += 1
+        # Count all unique Lead Status values in order of first appearance
+        if status_counts is None:
+            status_counts = DataProcessor.lead_status_counts(records)
         
         issues = []
         auto_suggestions = {}
@@ -80,14 +83,14 @@ class DataValidator:
                 auto_suggestion = normalized if normalized != status and normalized in valid_statuses else None
                 
                 # Get fuzzy matches
-                fuzzy_matches = get_close_matches(str(status), list(valid_statuses), n=2, cutoff=0.6)
+                fuzzy_matches = get_close_matches(str(status), valid_options, n=2, cutoff=0.6)
                 
                 issue = {
                     'original': status,
-                    'count': count,
+                    'count': int(count),
                     'auto_suggestion': auto_suggestion,
                     'fuzzy_matches': fuzzy_matches,
-                    'valid_options': list(valid_statuses)
+                    'valid_options': valid_options
                 }
                 
                 issues.append(issue)
@@ -99,12 +102,12 @@ class DataValidator:
         logger.info(f"Found {len(issues)} Lead Status issues affecting {sum(i['count'] for i in issues)} records")
         return issues, auto_suggestions
     
-    def apply_corrections(self, records: List[Dict[str, Any]], corrections: Dict[str, str]) -> Tuple[List[Dict[str, Any]], int]:
+    def apply_corrections(self, records: RecordSet, corrections: Dict[str, str]) -> Tuple[RecordSet, int]:
         """
         Apply user-selected corrections to the entire dataset.
         
         Args:
-            records: List of data records
+            records: Data records
             corrections: Dictionary mapping original values to corrected values
             
         Returns:
@@ -113,19 +116,14 @@ class DataValidator:
         if not corrections:
             return records, 0
         
-        corrected_records = []
-        correction_count = 0
+        # Factorize once, then correct through lookup tables indexed by value code
+        codes, uniques = DataProcessor.factorize(DataProcessor.get_column(records, 'Lead Status'))
+        corrected_lookup = np.array([corrections.get(status, status) for status in uniques] + [None], dtype=object)
+        is_corrected = np.array([status in corrections for status in uniques] + [False], dtype=bool)
+        correction_count = int(is_corrected.take(codes).sum())
         
-        for record in records:
-            corrected_record = record.copy()
-            
-            # Apply Lead Status correction if needed
-            original_status = record.get('Lead Status')
-            if original_status in corrections:
-                corrected_record['Lead Status'] = corrections[original_status]
-                correction_count += 1
-            
-            corrected_records.append(corrected_record)
+        # Only the Lead Status column is rewritten; the other columns are shared, not copied
+        corrected_records = records.assign(**{'Lead Status': pd.Series(corrected_lookup.take(codes), index=records.index)})
         
         # Store applied corrections
         self.corrections_applied = corrections.copy()
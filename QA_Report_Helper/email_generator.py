@@ -2,28 +2,34 @@
 Email content generation for QA Report Helper package.
 """
 
-from datetime import datetime
+from datetime import date
 from typing import Dict, List, Any
 
 
+def _ordinal_suffix(day: int) -> str:
+    """Ordinal suffix of a day of the month (1 -> 'st', 12 -> 'th', 22 -> 'nd')."""
+    if 10 <= day % 100 <= 20:
+        return 'th'
+    return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+
+
+# Suffix of every day of the month, indexed by day (index 0 unused)
+_ORDINAL_SUFFIXES = tuple(_ordinal_suffix(day) for day in range(32))
+
+# English month abbreviations, so report titles do not depend on the process locale like strftime('%b') does
+_MONTH_ABBREVIATIONS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
 class EmailContentGenerator:
     """Generates email content for downloading."""
     
     @staticmethod
     def format_today_date() -> str:
         """Format today's date in the required format (e.g., 2nd-Aug-2025)."""
-        today = datetime.now()
-        
-        # Get day with ordinal suffix
-        day = today.day
-        if 10 <= day % 100 <= 20:
-            suffix = 'th'
-        else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+        today = date.today()
         
         # Format: 2nd-Aug-2025
-        formatted_date = f"{day}{suffix}-{today.strftime('%b')}-{today.year}"
-        return formatted_date
+        return f"{today.day}{_ORDINAL_SUFFIXES[today.day]}-{_MONTH_ABBREVIATIONS[today.month - 1]}-{today.year}"
     
     @staticmethod
     def create_email_content(campaign_id: str, reports: Dict[str, List[List[Any]]]) -> str:
@@ -40,25 +46,34 @@ Please find the detailed QA analysis below:
 
 """
         
+        # Collect fragments and join once at the end instead of growing one string
+        parts = [email_content]
+        
+        # Row templates by row length; each row is laid out by its own cell count
+        row_formats = {}
+        
+        def format_row(row: List[Any]) -> str:
+            row_format = row_formats.get(len(row))
+            if row_format is None:
+                row_format = row_formats[len(row)] = " | ".join(["{:^15}"] * len(row))
+            return row_format.format(*map(str, row))
+        
         # Add each report as simple tables
         for report_name, report_data in reports.items():
             if report_data and len(report_data) > 1:
-                email_content += f"{report_name}:\n"
-                email_content += "=" * 60 + "\n"
+                parts.append(f"{report_name}:\n")
+                parts.append("=" * 60 + "\n")
                 
                 # Create simple table format
-                for row_idx, row in enumerate(report_data):
-                    if row_idx == 0:  # Header
-                        row_text = " | ".join(f"{str(cell):^15}" for cell in row)
-                        email_content += row_text + "\n"
-                        email_content += "-" * len(row_text) + "\n"
-                    else:  # Data rows
-                        row_text = " | ".join(f"{str(cell):^15}" for cell in row)
-                        email_content += row_text + "\n"
+                header_text = format_row(report_data[0])
+                parts.append(header_text + "\n")
+                parts.append("-" * len(header_text) + "\n")
+                for row in report_data[1:]:
+                    parts.append(format_row(row) + "\n")
                 
-                email_content += "\n"
+                parts.append("\n")
         
-        email_content += """Summary:
+        parts.append("""Summary:
 • Total leads processed and qualification rates are shown in the PRE QA / POST QA section
 • Agent-wise performance breakdown helps identify training needs
 • Primary disqualification reasons highlight common data quality issues
@@ -66,6 +81,6 @@ Please find the detailed QA analysis below:
 Please review and let me know if you need any clarification.
 
 Best regards,
-QA Team"""
+QA Team""")
         
-        return email_content
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
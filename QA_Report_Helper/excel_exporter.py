@@ -4,20 +4,43 @@ Updated to include date information in reports.
 """
 
 import io
-from datetime import datetime, date
-from typing import Dict, List, Any
-from openpyxl import Workbook
-from openpyxl.styles import Font
-from openpyxl.worksheet.worksheet import Worksheet
+import logging
+from copy import copy
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain
+from datetime import date
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, Iterator, List, Any, Tuple
 
 from .config import ExcelStyling
+from .email_generator import EmailContentGenerator
+
+# openpyxl is imported on first export rather than with the package
+if TYPE_CHECKING:
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+logger = logging.getLogger(__name__)
+
+# XlsxWriter equivalents of the openpyxl border and vertical alignment names used by ExcelStyling
+_XLSXWRITER_BORDERS = {"thin": 1, "medium": 2, "dashed": 3, "dotted": 4, "thick": 5, "double": 6, "hair": 7}
+_XLSXWRITER_VALIGN = {"top": "top", "center": "vcenter", "bottom": "bottom"}
+
+
+@lru_cache(maxsize=None)
+def _email_font(bold: bool, size: int) -> "Font":
+    """Font of an email text line, built once per (bold, size) and shared by every export."""
+    from openpyxl.styles import Font
+    return Font(bold=bold, size=size)
 
 
 class ExcelExporter:
     """Handles Excel file generation with professional formatting."""
     
-    def __init__(self, styling: ExcelStyling):
+    def __init__(self, styling: ExcelStyling, use_xlsxwriter: bool = False):
         self.styling = styling
+        self.use_xlsxwriter = use_xlsxwriter
     
     def create_excel_report(
         self, 
@@ -26,113 +49,225 @@ class ExcelExporter:
         selected_date: date = None
     ) -> bytes:
         """Create formatted Excel report with email content and date information."""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "QA_Report"
+        output = io.BytesIO()
+        self.write_excel_report(output, reports, campaign_id, selected_date)
+        return output.getvalue()
+    
+    def write_excel_report(
+        self,
+        sink: BinaryIO,
+        reports: Dict[str, List[List[Any]]],
+        campaign_id: str = "",
+        selected_date: date = None
+    ) -> None:
+        """
+        Write the formatted Excel report straight into a binary stream.
         
-        current_row = 1
+        Callers that save to a file or a response body can pass it as the sink
+        instead of holding the whole workbook in memory as bytes first.
+        """
+        header_lines = []
+        footer_lines = []
         
-        # Add email content at the top if campaign_id is provided
+        # Add email content at the top if campaign_id is provided; lines are (text, bold, font size)
         if campaign_id:
             date_str = selected_date.strftime("%d-%b-%y") if selected_date else self._format_today_date()
             
-            # Email greeting and header
-            ws.cell(row=current_row, column=1, value="Hi Team,").font = Font(bold=False, size=11)
-            current_row += 2
-            
-            ws.cell(row=current_row, column=1, value=f"PFB QA_Report_{campaign_id}_{date_str}").font = Font(bold=True, size=12)
-            current_row += 2
-        
-        # Add Combined QA Report first
-        if "Combined QA Report" in reports:
-            current_row = self._add_report_to_worksheet(ws, reports["Combined QA Report"], current_row)
-            current_row += 1
-        
-        # Add optional reports next (Segment and JT Persona)
-        optional_reports = ["Segment Wise Qualified Count", "JT Persona Wise Qualified Count"]
-        for report_name in optional_reports:
-            if report_name in reports:
-                current_row = self._add_report_to_worksheet(ws, reports[report_name], current_row)
-                current_row += 1  # Add spacing between reports
-        
-        # Add core reports last (Agent Wise Summary, Primary Reason Disqualified)
-        core_reports = ["Agent Wise Summary", "Primary Reason Disqualified"]
-        for report_name in core_reports:
-            if report_name in reports:
-                current_row = self._add_report_to_worksheet(ws, reports[report_name], current_row)
-                current_row += 1  # Add spacing between reports
-        
-        # Add summary at the end if campaign_id is provided
-        if campaign_id:
-            ws.cell(row=current_row, column=1, value="Best regards,").font = Font(bold=False, size=11)
-            current_row += 1
+            # Email greeting and header, each followed by a blank row
+            header_lines = [
+                ("Hi Team,", False, 11),
+                (f"PFB QA_Report_{campaign_id}_{date_str}", True, 12)
+            ]
+            footer_lines = [("Best regards,", False, 11)]
         
-        # Auto-fit columns
-        self._auto_fit_columns(ws)
+        # Combined QA Report first, optional reports (Segment and JT Persona) next, core reports last
+        report_order = [
+            "Combined QA Report",
+            "Segment Wise Qualified Count", "JT Persona Wise Qualified Count",
+            "Agent Wise Summary", "Primary Reason Disqualified"
+        ]
+        ordered_reports = [reports[report_name] for report_name in report_order if report_name in reports]
         
-        # Save to bytes
-        output = io.BytesIO()
-        wb.save(output)
-        return output.getvalue()
+        # Auto-fit columns from the plain values; both writers need widths before the first row is written
+        text_rows = [[text] for text, _, _ in header_lines + footer_lines]
+        column_widths = self._column_widths(chain(text_rows, *ordered_reports))
+        
+        if self.use_xlsxwriter:
+            if find_spec("xlsxwriter") is None:
+                logger.warning("USE_XLSXWRITER is enabled but xlsxwriter is not installed, falling back to openpyxl")
+            else:
+                self._write_with_xlsxwriter(sink, header_lines, ordered_reports, footer_lines, column_widths)
+                return
+        
+        self._write_with_openpyxl(sink, header_lines, ordered_reports, footer_lines, column_widths)
+    
+    def _write_with_openpyxl(
+        self,
+        sink: BinaryIO,
+        header_lines: List[Tuple[str, bool, int]],
+        ordered_reports: List[List[List[Any]]],
+        footer_lines: List[Tuple[str, bool, int]],
+        column_widths: Dict[int, float]
+    ) -> None:
+        """Write the report through a write-only openpyxl workbook into the sink."""
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+        
+        # Write-only workbooks stream rows straight into the saved file instead of keeping every cell in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("QA_Report")
+        
+        for col_idx, width in column_widths.items():
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+        
+        for text, bold, size in header_lines:
+            ws.append([self._text_cell(ws, text, _email_font(bold, size))])
+            ws.append([])
+        
+        # Report cells are created row by row as they are written, never held for the whole sheet
+        for report_data in ordered_reports:
+            for row in self._iter_report_rows(ws, report_data):
+                ws.append(row)
+            ws.append([])  # Add spacing between reports
+        
+        for text, bold, size in footer_lines:
+            ws.append([self._text_cell(ws, text, _email_font(bold, size))])
+        
+        wb.save(sink)
+    
+    def _write_with_xlsxwriter(
+        self,
+        sink: BinaryIO,
+        header_lines: List[Tuple[str, bool, int]],
+        ordered_reports: List[List[List[Any]]],
+        footer_lines: List[Tuple[str, bool, int]],
+        column_widths: Dict[int, float]
+    ) -> None:
+        """Write the same report layout with XlsxWriter into the sink."""
+        import xlsxwriter
+        
+        workbook = xlsxwriter.Workbook(sink, {"in_memory": True})
+        ws = workbook.add_worksheet("QA_Report")
+        
+        # Formats are created once per workbook and shared by every cell that uses them
+        formats = {
+            style: self._xlsxwriter_format(workbook, font, fill)
+            for style, (font, fill) in self._report_styles().items()
+        }
+        text_formats = {
+            (bold, size): workbook.add_format({"bold": bold, "font_size": size})
+            for _, bold, size in header_lines + footer_lines
+        }
+        
+        for col_idx, width in column_widths.items():
+            ws.set_column(col_idx - 1, col_idx - 1, width)
+        
+        row_idx = 0
+        for text, bold, size in header_lines:
+            ws.write(row_idx, 0, text, text_formats[bold, size])
+            row_idx += 2
+        
+        for report_data in ordered_reports:
+            total_rows = len(report_data)
+            for report_row_idx, row_data in enumerate(report_data):
+                row_styles = self._row_styles(row_data, report_row_idx, total_rows)
+                for col_idx, (value, style) in enumerate(zip(row_data, row_styles)):
+                    ws.write(row_idx, col_idx, value, formats[style])
+                row_idx += 1
+            row_idx += 1  # Add spacing between reports
+        
+        for text, bold, size in footer_lines:
+            ws.write(row_idx, 0, text, text_formats[bold, size])
+            row_idx += 1
+        
+        workbook.close()
+    
+    def _xlsxwriter_format(self, workbook, font=None, fill=None):
+        """Translate the shared ExcelStyling cell style (and an optional font and fill) into an XlsxWriter format."""
+        alignment = self.styling.center_alignment
+        properties = {
+            "align": alignment.horizontal,
+            "valign": _XLSXWRITER_VALIGN[alignment.vertical],
+            "border": _XLSXWRITER_BORDERS[self.styling.thin_border.left.style]
+        }
+        if font is not None:
+            properties["bold"] = bool(font.b)
+        if fill is not None:
+            properties["bg_color"] = f"#{fill.fgColor.rgb[-6:]}"
+        return workbook.add_format(properties)
     
     def _format_today_date(self) -> str:
         """Format today's date in the required format (e.g., 2nd-Aug-2025)."""
-        today = datetime.now()
-        
-        # Get day with ordinal suffix
-        day = today.day
-        if 10 <= day % 100 <= 20:
-            suffix = 'th'
-        else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-        
-        # Format: 2nd-Aug-2025
-        formatted_date = f"{day}{suffix}-{today.strftime('%b')}-{today.year}"
-        return formatted_date
+        return EmailContentGenerator.format_today_date()
+    
+    def _report_styles(self) -> Dict[str, Tuple[Any, Any]]:
+        """Font and fill of each report style name; body cells keep the workbook default font and no fill."""
+        return {
+            "qa_body": (None, None),
+            "qa_header": (self.styling.header_font, self.styling.header_fill),
+            "qa_grand_total": (self.styling.grand_total_font, self.styling.grand_total_fill)
+        }
     
-    def _add_report_to_worksheet(self, ws: Worksheet, report_data: List[List[Any]], start_row: int) -> int:
-        """Add a single report to the worksheet with formatting."""
-        current_row = start_row
+    @staticmethod
+    def _text_cell(ws: "WriteOnlyWorksheet", value: str, font) -> "WriteOnlyCell":
+        """Create a write-only cell holding email text in the given font."""
+        from openpyxl.cell import WriteOnlyCell
+        
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        return cell
+    
+    def _iter_report_rows(self, ws: "WriteOnlyWorksheet", report_data: List[List[Any]]) -> Iterator[List["WriteOnlyCell"]]:
+        """Yield the formatted worksheet rows for a single report."""
+        from openpyxl.cell import WriteOnlyCell
+        
+        total_rows = len(report_data)
+        
+        # Each style is resolved against the workbook once; cells copy its style indices instead of looking every object up again
+        style_arrays = {}
+        for style, (font, fill) in self._report_styles().items():
+            template = WriteOnlyCell(ws)
+            template.alignment = self.styling.center_alignment
+            template.border = self.styling.thin_border
+            if font is not None:
+                template.font = font
+                template.fill = fill
+            style_arrays[style] = template._style
         
         for row_idx, row_data in enumerate(report_data):
-            # Add data to cells
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=current_row, column=col_idx, value=value)
-                self._apply_cell_formatting(cell, row_idx, len(report_data))
+            row = []
+            for value, style in zip(row_data, self._row_styles(row_data, row_idx, total_rows)):
+                cell = WriteOnlyCell(ws, value=value)
+                cell._style = copy(style_arrays[style])
+                row.append(cell)
             
-            current_row += 1
-        
-        return current_row
+            yield row
     
-    def _apply_cell_formatting(self, cell, row_idx: int, total_rows: int) -> None:
-        """Apply formatting to a cell based on its position."""
-        cell.alignment = self.styling.center_alignment
-        cell.border = self.styling.thin_border
-        
+    @staticmethod
+    def _row_styles(row_data: List[Any], row_idx: int, total_rows: int) -> List[str]:
+        """Report style name of each cell in a row; header and closing rows are resolved once for the whole row."""
         # Header row formatting
         if row_idx == 0:
-            cell.fill = self.styling.header_fill
-            cell.font = self.styling.header_font
-        
-        # Grand Total row formatting
-        elif (isinstance(cell.value, str) and cell.value.lower().strip() == "grand total") or \
-             (row_idx == total_rows - 1 and total_rows > 2):
-            cell.fill = self.styling.grand_total_fill
-            cell.font = self.styling.grand_total_font
+            return ["qa_header"] * len(row_data)
+        
+        # Grand Total row formatting: the closing row of a report with body rows
+        if row_idx == total_rows - 1 and total_rows > 2:
+            return ["qa_grand_total"] * len(row_data)
+        
+        # Any other cell is only highlighted when it reads "Grand Total" itself
+        return [
+            "qa_grand_total" if isinstance(value, str) and value.lower().strip() == "grand total" else "qa_body"
+            for value in row_data
+        ]
     
-    def _auto_fit_columns(self, ws: Worksheet) -> None:
-        """Auto-fit column widths based on content."""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    cell_length = len(str(cell.value)) if cell.value is not None else 0
-                    max_length = max(max_length, cell_length)
-                except:
-                    pass
-            
-            # Set width with padding
-            adjusted_width = min(max_length + 3, 50)  # Cap at 50 characters
-            ws.column_dimensions[column_letter].width = adjusted_width
\ No newline at end of file
+    @staticmethod
+    def _column_widths(rows: Iterable[List[Any]]) -> Dict[int, float]:
+        """Auto-fit column widths (1-based column index to width) from the values that will be written."""
+        column_lengths = {}
+        for row in rows:
+            for col_idx, value in enumerate(row, 1):
+                cell_length = len(str(value)) if value is not None else 0
+                column_lengths[col_idx] = max(column_lengths.get(col_idx, 0), cell_length)
+        
+        # Set width with padding, capped at 50 characters
+        return {col_idx: min(max_length + 3, 50) for col_idx, max_length in column_lengths.items()}
\ No newline at end of file
@@ -13,6 +13,41 @@ from utils.config import BASE_DIR
 
 logger = logging.getLogger(__name__)
 
+# Sub-folder listings by path, kept with the folder mtime they were read at. A FileSelector is
+# built on every rerun, so the cache lives at module level to survive between them.
+_LISTING_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+class NetworkFile:
+    """
+    Lightweight handle to a workbook on the network path; content is read only when parsed.
+    
+    The file can be rewritten on the share between selecting and parsing it, so size,
+    modification time and cache key are read from the share each time they are asked for.
+    """
+    
+    def __init__(self, path: str):
+        os.stat(path)  # Fail on selection when the file is missing or unreadable
+        self.path = path
+        self.name = os.path.basename(path)
+    
+    def __fspath__(self) -> str:
+        return self.path
+    
+    @property
+    def size(self) -> int:
+        return os.stat(self.path).st_size
+    
+    @property
+    def modified(self) -> float:
+        return os.stat(self.path).st_mtime
+    
+    @property
+    def cache_key(self) -> str:
+        """Identity of the file as seen on the share now; changes whenever the file is rewritten."""
+        stat = os.stat(self.path)
+        return f"{self.path}|{stat.st_size}|{stat.st_mtime}"
+
 
 class FileSelector:
     """Handles hierarchical file selection from network paths (Month → Campaign → File)."""
@@ -28,7 +63,26 @@ class FileSelector:
             base_dir: Base directory path. If None, uses BASE_DIR
         """
         self.base_dir = base_dir or self.BASE_DIR
-        self.supported_extensions = ['.xlsx', '.xlsm']
+        self.supported_extensions = ('.xlsx', '.xlsm')  # A tuple, so str.endswith can test them all at once
+    
+    @staticmethod
+    def _list_folders(path: str) -> List[str]:
+        """
+        Names of the sub-folders in a folder.
+        
+        Adding, removing or renaming an entry changes the folder's own mtime, so the
+        listing is only re-read from the share when that mtime differs from the cached one.
+        """
+        folder_mtime = os.stat(path).st_mtime
+        cached = _LISTING_CACHE.get(path)
+        if cached is not None and cached[0] == folder_mtime:
+            return cached[1]
+        
+        with os.scandir(path) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+        
+        _LISTING_CACHE[path] = (folder_mtime, names)
+        return names
     
     def path_exists(self, path: str = None) -> bool:
         """Check if path exists and is accessible."""
@@ -53,13 +107,8 @@ class FileSelector:
             return months
         
         try:
-            for item in os.listdir(self.base_dir):
-                item_path = os.path.join(self.base_dir, item)
-                if os.path.isdir(item_path):
-                    months.append(item)
-            
             # Sort months (you can customize sorting logic)
-            months.sort()
+            months = sorted(self._list_folders(self.base_dir))
             
             logger.info(f"Found {len(months)} month folders")
             return months
@@ -86,13 +135,8 @@ class FileSelector:
             return campaigns
         
         try:
-            for item in os.listdir(month_path):
-                item_path = os.path.join(month_path, item)
-                if os.path.isdir(item_path):
-                    campaigns.append(item)
-            
             # Sort campaigns
-            campaigns.sort()
+            campaigns = sorted(self._list_folders(month_path))
             
             logger.info(f"Found {len(campaigns)} campaign folders in {month}")
             return campaigns
@@ -120,19 +164,18 @@ class FileSelector:
             return files
         
         try:
-            for file in os.listdir(campaign_path):
-                file_path = os.path.join(campaign_path, file)
-                
-                # Check if it's a file and has correct extension
-                if os.path.isfile(file_path):
-                    _, ext = os.path.splitext(file)
-                    if ext.lower() in self.supported_extensions:
+            # Read fresh on every call: a workbook saved in place keeps its folder's mtime. On Windows
+            # shares each entry's type and stat come with the directory read itself
+            with os.scandir(campaign_path) as entries:
+                for entry in entries:
+                    # Check the extension first: it needs no file-system call
+                    if entry.name.lower().endswith(self.supported_extensions) and entry.is_file():
                         # Get file metadata
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                        size_bytes = os.path.getsize(file_path)
-                        size_mb = size_bytes / (1024 * 1024)
+                        stat = entry.stat()
+                        mod_time = datetime.fromtimestamp(stat.st_mtime)
+                        size_mb = stat.st_size / (1024 * 1024)
                         
-                        files.append((file, file_path, mod_time, size_mb))
+                        files.append((entry.name, entry.path, mod_time, size_mb))
             
             # Sort by modification time (newest first)
             files.sort(key=lambda x: x[2], reverse=True)
@@ -175,6 +218,25 @@ class FileSelector:
             logger.error(f"Error reading file {file_path}: {str(e)}")
             return None
     
+    def open_file(self, file_path: str) -> Optional[NetworkFile]:
+        """
+        Open a lightweight handle to a file on the network path.
+        
+        The workbook is parsed straight from the share, so its bytes are not
+        kept in session state between reruns.
+        
+        Args:
+            file_path: Full path to the file
+        
+        Returns:
+            NetworkFile handle, or None if error
+        """
+        try:
+            return NetworkFile(file_path)
+        except Exception as e:
+            logger.error(f"Error opening file {file_path}: {str(e)}")
+            return None
+    
     def validate_file_access(self, file_path: str) -> Tuple[bool, str]:
         """
         Validate that file exists and is readable.
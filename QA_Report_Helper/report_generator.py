@@ -3,19 +3,39 @@ Report generation logic for QA Report Helper package.
 Updated to support date-filtered and MTD reporting.
 """
 
-from typing import Dict, List, Any
-from collections import defaultdict, Counter
+from typing import List, Any
 
-from .data_processor import DataProcessor
+import numpy as np
+import pandas as pd
+
+from .data_processor import DataProcessor, RecordSet
 
 
 class ReportGenerator:
     """Generates various reports from processed data with date filtering support."""
     
+    @staticmethod
+    def _lead_status(records: RecordSet) -> pd.Series:
+        """Normalized Lead Status column of the records."""
+        return DataProcessor.normalized_lead_status(records)
+    
+    @staticmethod
+    def _most_common(values: pd.Series) -> List[tuple]:
+        """(value, count) pairs by count descending, ties in order of first appearance (like Counter.most_common)."""
+        counts = values.value_counts(sort=False, dropna=False)
+        return sorted(zip(counts.index, counts.tolist()), key=lambda item: item[1], reverse=True)
+    
+    @staticmethod
+    def _tag_label(tag: Any) -> str:
+        """Display label for a Segment/JT Persona tag; blank tags count as (Blank)."""
+        if tag is None or str(tag).strip() == "":
+            return "(Blank)"
+        return str(tag).strip()
+    
     @staticmethod
     def generate_combined_qa_report(
-        date_records: List[Dict[str, Any]], 
-        mtd_records: List[Dict[str, Any]]
+        date_records: RecordSet, 
+        mtd_records: RecordSet
     ) -> List[List[Any]]:
         """
         Generate combined MTD and daily QA report in a single table.
@@ -26,17 +46,11 @@ class ReportGenerator:
         """
         # Daily counts (selected date only)
         daily_total = len(date_records)
-        daily_qualified = sum(
-            1 for r in date_records 
-            if DataProcessor.normalize(r.get("Lead Status", "")) == "qualified"
-        )
+        daily_qualified = int(ReportGenerator._lead_status(date_records).eq("qualified").sum())
         
         # MTD counts (month-to-date)
         mtd_total = len(mtd_records)
-        mtd_qualified = sum(
-            1 for r in mtd_records 
-            if DataProcessor.normalize(r.get("Lead Status", "")) == "qualified"
-        )
+        mtd_qualified = int(ReportGenerator._lead_status(mtd_records).eq("qualified").sum())
         
         return [
             ["MTD PRE QA", "MTD POST QA", "PRE QA", "POST QA"],
@@ -44,66 +58,56 @@ class ReportGenerator:
         ]
     
     @staticmethod
-    def generate_agent_breakdown_report(records: List[Dict[str, Any]]) -> List[List[Any]]:
+    def generate_agent_breakdown_report(records: RecordSet) -> List[List[Any]]:
         """Generate agent-wise breakdown report (date-filtered)."""
-        agent_data = defaultdict(lambda: {"qualified": 0, "disqualified": 0})
+        statuses = ReportGenerator._lead_status(records)
+        counted = statuses.isin(["qualified", "disqualified"]).to_numpy()
+        agents = DataProcessor.get_column(records, "Agent Name", "(Blank)")[counted]
+        is_qualified = statuses[counted].eq("qualified").to_numpy()
         
-        for record in records:
-            agent = record.get("Agent Name", "(Blank)")
-            status = DataProcessor.normalize(record.get("Lead Status", ""))
-            
-            if status in ["qualified", "disqualified"]:
-                agent_data[agent][status] += 1
+        # Agent codes follow first appearance, which fixes the agent order before sorting
+        agent_codes, agent_names = pd.factorize(agents, use_na_sentinel=False)
         
-        # Calculate metrics and sort
+        # One histogram pass over (agent, status) pair codes: column 0 disqualified, column 1 qualified
+        pair_counts = np.bincount(agent_codes * 2 + is_qualified, minlength=2 * len(agent_names)).reshape(-1, 2)
+        
+        # Calculate metrics and format each display row in one walk; the error fraction is kept beside it for sorting
         agent_rows = []
-        for agent, counts in agent_data.items():
-            grand_total = counts["qualified"] + counts["disqualified"]
-            error_pct = counts["disqualified"] / grand_total if grand_total > 0 else 0
-            
-            agent_rows.append([
-                agent, counts["disqualified"], counts["qualified"], grand_total, error_pct
-            ])
+        for agent, (disqualified, qualified) in zip(agent_names, pair_counts.tolist()):
+            grand_total = qualified + disqualified
+            error_pct = disqualified / grand_total if grand_total > 0 else 0
+            agent_rows.append((error_pct, [agent, disqualified, qualified, grand_total, f"{error_pct:.0%}"]))  # Round to whole percent
         
         # Sort by error percentage descending
-        agent_rows.sort(key=lambda x: x[4], reverse=True)
+        agent_rows.sort(key=lambda x: x[0], reverse=True)
         
-        # Add grand total row
+        report = [["Agent Name", "Disqualified", "Qualified", "Grand Total", "Error%"]]
+        report.extend(row for _, row in agent_rows)
+        
+        # Add grand total row, summed from the pair counts
         if agent_rows:
-            sum_disqualified = sum(row[1] for row in agent_rows)
-            sum_qualified = sum(row[2] for row in agent_rows)
-            sum_total = sum(row[3] for row in agent_rows)
+            sum_disqualified, sum_qualified = pair_counts.sum(axis=0).tolist()
+            sum_total = sum_disqualified + sum_qualified
             sum_error_pct = sum_disqualified / sum_total if sum_total > 0 else 0
             
-            agent_rows.append([
-                "Grand Total", sum_disqualified, sum_qualified, sum_total, sum_error_pct
+            report.append([
+                "Grand Total", sum_disqualified, sum_qualified, sum_total, f"{sum_error_pct:.0%}"
             ])
         
-        # Format for display
-        report = [["Agent Name", "Disqualified", "Qualified", "Grand Total", "Error%"]]
-        for row in agent_rows:
-            display_row = row[:4] + [f"{row[4]:.0%}"]  # Round to whole percent
-            report.append(display_row)
-        
         return report
         
     @staticmethod
-    def generate_segment_wise_report(records: List[Dict[str, Any]]) -> List[List[Any]]:
+    def generate_segment_wise_report(records: RecordSet) -> List[List[Any]]:
         """Generate segment-wise qualified count report (uses ALL qualified records)."""
-        segment_counts = Counter()
-        
-        for record in records:
-            if DataProcessor.normalize(record.get("Lead Status", "")) == "qualified":
-                segment = record.get("Segment Tagging", "(Blank)")
-                if segment is None or str(segment).strip() == "":
-                    segment = "(Blank)"
-                else:
-                    segment = str(segment).strip()
-                segment_counts[segment] += 1
+        qualified = ReportGenerator._lead_status(records).eq("qualified").to_numpy()
+        segments = DataProcessor.map_unique(
+            DataProcessor.get_column(records, "Segment Tagging", "(Blank)")[qualified],
+            ReportGenerator._tag_label, "(Blank)"
+        )
         
         # Sort by count descending
         segment_rows = []
-        for segment, count in segment_counts.most_common():
+        for segment, count in ReportGenerator._most_common(segments):
             segment_rows.append([segment, count])
         
         # Add grand total
@@ -118,22 +122,17 @@ class ReportGenerator:
         return report
     
     @staticmethod
-    def generate_jt_persona_wise_report(records: List[Dict[str, Any]]) -> List[List[Any]]:
+    def generate_jt_persona_wise_report(records: RecordSet) -> List[List[Any]]:
         """Generate JT persona-wise qualified count report (uses ALL qualified records)."""
-        persona_counts = Counter()
-        
-        for record in records:
-            if DataProcessor.normalize(record.get("Lead Status", "")) == "qualified":
-                persona = record.get("JT Persona Tagging", "(Blank)")
-                if persona is None or str(persona).strip() == "":
-                    persona = "(Blank)"
-                else:
-                    persona = str(persona).strip()
-                persona_counts[persona] += 1
+        qualified = ReportGenerator._lead_status(records).eq("qualified").to_numpy()
+        personas = DataProcessor.map_unique(
+            DataProcessor.get_column(records, "JT Persona Tagging", "(Blank)")[qualified],
+            ReportGenerator._tag_label, "(Blank)"
+        )
         
         # Sort by count descending
         persona_rows = []
-        for persona, count in persona_counts.most_common():
+        for persona, count in ReportGenerator._most_common(personas):
             persona_rows.append([persona, count])
         
         # Add grand total
@@ -148,36 +147,30 @@ class ReportGenerator:
         return report
     
     @staticmethod
-    def generate_dq_reason_report(records: List[Dict[str, Any]]) -> List[List[Any]]:
+    def generate_dq_reason_report(records: RecordSet) -> List[List[Any]]:
         """Generate primary reason disqualified report (date-filtered)."""
         total_leads = len(records)
         
         # Count DQ reasons
-        reason_counts = Counter()
-        for record in records:
-            if DataProcessor.normalize(record.get("Lead Status", "")) == "disqualified":
-                reason = record.get("DQ Reason", "(Blank)")
-                reason_counts[reason] += 1
+        disqualified = ReportGenerator._lead_status(records).eq("disqualified").to_numpy()
+        reason_counts = DataProcessor.get_column(records, "DQ Reason", "(Blank)")[disqualified].value_counts(sort=False, dropna=False)
         
-        # Calculate metrics and sort
+        # Calculate metrics and format each display row in one walk; the error fraction is kept beside it for sorting
         reason_rows = []
-        for reason, count in reason_counts.items():
+        for reason, count in zip(reason_counts.index, reason_counts.tolist()):
             error_pct = count / total_leads if total_leads > 0 else 0
-            reason_rows.append([reason, count, error_pct])
+            reason_rows.append((error_pct, [reason, count, f"{error_pct:.0%}"]))  # Round to whole percent
         
         # Sort by error percentage descending
-        reason_rows.sort(key=lambda x: x[2], reverse=True)
+        reason_rows.sort(key=lambda x: x[0], reverse=True)
         
-        # Add grand total
+        report = [["DQ Reason", "Disqualified", "Error%"]]
+        report.extend(row for _, row in reason_rows)
+        
+        # Add grand total: every disqualified lead is counted under exactly one reason
         if reason_rows:
-            total_disqualified = sum(row[1] for row in reason_rows)
+            total_disqualified = int(disqualified.sum())
             grand_error_pct = total_disqualified / total_leads if total_leads > 0 else 0
-            reason_rows.append(["Grand Total", total_disqualified, grand_error_pct])
-        
-        # Format for display
-        report = [["DQ Reason", "Disqualified", "Error%"]]
-        for row in reason_rows:
-            display_row = [row[0], row[1], f"{row[2]:.0%}"]  # Round to whole percent
-            report.append(display_row)
+            report.append(["Grand Total", total_disqualified, f"{grand_error_pct:.0%}"])
         
         return report
\ No newline at end of file
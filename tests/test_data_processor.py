@@ -0,0 +1,264 @@
+"""
+Tests for DataProcessor's vectorized and per-distinct-value helpers.
+"""
+
+import io
+import unittest
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from QA_Report_Helper.config import Config
+from QA_Report_Helper.data_processor import EXCEL_ENGINE, DataProcessor, _excel_serials_to_dates, _parse_date_text
+
+
+# The strptime formats parse_date tries, in order, before falling back to Excel serial numbers
+STRPTIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%d",
+    "%d-%b-%y", "%d-%B-%y", "%d-%b-%Y", "%d-%B-%Y",
+    "%d/%b/%y", "%d/%B/%y", "%d/%b/%Y", "%d/%B/%Y",
+    "%d.%b.%y", "%d.%B.%y",
+    "%d-%m-%Y", "%d/%m/%Y", "%d-%m-%y", "%d/%m/%y",
+    "%m/%d/%Y", "%m-%d-%Y", "%m/%d/%y", "%m-%d-%y",
+)
+
+
+def strptime_date(date_str):
+    """The date strptime reads from a stripped string with the first matching format, or None."""
+    for fmt in STRPTIME_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class MixedTypeColumnTest(unittest.TestCase):
+    """Equal values of different types (True, 1, 1.0) must keep their own per-row results."""
+    
+    def test_map_unique_keeps_bool_and_numbers_apart(self):
+        values = pd.Series(["Ann", 1, True, 1.0, None, True, 1], dtype=object)
+        
+        mapped = DataProcessor.map_unique(values, str, "(Blank)")
+        
+        self.assertEqual(mapped.tolist(), ["Ann", "1", "True", "1.0", "(Blank)", "True", "1"])
+    
+    def test_normalize_series_keeps_bool_and_int_apart(self):
+        normalized = DataProcessor.normalize_series(pd.Series([True, 1], dtype=object))
+        
+        self.assertEqual(normalized.tolist(), ["true", "1"])
+    
+    def test_clean_data_matches_per_row_str(self):
+        records = pd.DataFrame({
+            "Lead Status": ["Qualified", "Qualified", "Disqualified", "Disqualified"],
+            "Agent Name": [True, 1, "Ann", 1.0],
+            "DQ Reason": [None, None, 1, True]
+        }, dtype=object)
+        
+        cleaned = DataProcessor(Config()).clean_data(records)
+        
+        self.assertEqual(cleaned["Agent Name"].tolist(), ["True", "1", "Ann", "1.0"])
+        self.assertEqual(cleaned["DQ Reason"].tolist(), ["(Blank)", "(Blank)", "1", "True"])
+    
+    @unittest.skipUnless(EXCEL_ENGINE == "calamine", "calamine reader not installed")
+    def test_calamine_read_keeps_bool_and_numbers_apart(self):
+        from openpyxl import Workbook
+        
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Qualified"
+        ws.append(["Lead Status", "Agent Name", "DQ Reason"])
+        ws.append([True, "Ann", 1])
+        ws.append([1, "Bob", 1.5])
+        ws.append(["Qualified", True, 1])
+        workbook_file = io.BytesIO()
+        wb.save(workbook_file)
+        workbook_file.seek(0)
+        
+        _, records = DataProcessor(Config()).load_and_parse_excel(workbook_file)
+        
+        self.assertEqual(records["Lead Status"].map(repr).tolist(), ["True", "1", "'Qualified'"])
+        self.assertEqual(records["Agent Name"].map(repr).tolist(), ["'Ann'", "'Bob'", "True"])
+
+
+class DateTextParsingTest(unittest.TestCase):
+    """_parse_date_text matches strptime with the supported formats without calling it."""
+    
+    def assertParses(self, cases):
+        for date_str, expected in cases:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(_parse_date_text(date_str), expected)
+                if strptime_date(date_str) is not None:
+                    self.assertEqual(strptime_date(date_str), expected)
+    
+    def test_each_supported_format(self):
+        self.assertParses([
+            ("2025-11-06 13:45:10", date(2025, 11, 6)),
+            ("2025-11-06", date(2025, 11, 6)),
+            ("06-Nov-25", date(2025, 11, 6)),
+            ("06-November-25", date(2025, 11, 6)),
+            ("06-Nov-2025", date(2025, 11, 6)),
+            ("06-November-2025", date(2025, 11, 6)),
+            ("06/Nov/25", date(2025, 11, 6)),
+            ("06/November/25", date(2025, 11, 6)),
+            ("06/Nov/2025", date(2025, 11, 6)),
+            ("06/November/2025", date(2025, 11, 6)),
+            ("06.Nov.25", date(2025, 11, 6)),
+            ("06.November.25", date(2025, 11, 6)),
+            ("06-11-2025", date(2025, 11, 6)),
+            ("06/11/2025", date(2025, 11, 6)),
+            ("06-11-25", date(2025, 11, 6)),
+            ("06/11/25", date(2025, 11, 6)),
+            # Day-first formats are tried first, so the US formats only read a day above 12
+            ("11/13/2025", date(2025, 11, 13)),
+            ("11-13-2025", date(2025, 11, 13)),
+            ("11/13/25", date(2025, 11, 13)),
+            ("11-13-25", date(2025, 11, 13)),
+        ])
+    
+    def test_month_names_and_single_digits(self):
+        self.assertParses([
+            ("6-nov-25", date(2025, 11, 6)),
+            ("6-NOVEMBER-2025", date(2025, 11, 6)),
+            ("1/2/2025", date(2025, 2, 1)),
+            ("2025-1-2", date(2025, 1, 2)),
+            ("06-Sept-25", None),
+            ("06-Novem-25", None),
+        ])
+    
+    def test_bad_days_and_months(self):
+        self.assertParses([
+            ("32-Jan-25", None),
+            ("31-Apr-25", None),
+            ("00-Jan-25", None),
+            ("2025-02-30", None),
+            ("2025-13-01", None),
+            ("2025-00-10", None),
+            ("13/13/2025", None),
+            ("31/04/2025", None),
+            ("2025-11-06 24:00:00", date(2025, 11, 6)),
+            ("2025-11-31 10:00:00", None),
+        ])
+    
+    def test_leap_years(self):
+        self.assertParses([
+            ("29-Feb-24", date(2024, 2, 29)),
+            ("29-Feb-25", None),
+            ("2000-02-29", date(2000, 2, 29)),
+            ("1900-02-29", None),
+            ("29/02/2100", None),
+            ("02/29/2028", date(2028, 2, 29)),
+        ])
+    
+    def test_two_digit_year_pivot(self):
+        self.assertParses([
+            ("01-Jan-00", date(2000, 1, 1)),
+            ("01-Jan-68", date(2068, 1, 1)),
+            ("01-Jan-69", date(1969, 1, 1)),
+            ("31/12/99", date(1999, 12, 31)),
+            ("01-Jan-025", None),
+        ])
+    
+    def test_excel_serial_text(self):
+        self.assertParses([
+            ("45967", date(2025, 11, 6)),
+            ("45967.75", date(2025, 11, 6)),
+            ("60", date(1900, 2, 28)),
+            ("61", date(1900, 3, 1)),
+            ("1e5", None),
+        ])
+    
+    def test_parse_date_strips_surrounding_whitespace(self):
+        processor = DataProcessor(Config())
+        
+        self.assertEqual(processor.parse_date("  06-Nov-25\t"), date(2025, 11, 6))
+        self.assertEqual(processor.parse_date("\n2025-11-06 08:00:00 "), date(2025, 11, 6))
+        self.assertEqual(processor.parse_date(" 45967 "), date(2025, 11, 6))
+        self.assertIsNone(processor.parse_date("   "))
+        self.assertIsNone(processor.parse_date("06 - Nov - 25"))
+
+
+class ExcelSerialDateTest(unittest.TestCase):
+    """The vectorized Excel serial conversion gives the dates parse_date reads from each serial on its own."""
+    
+    def test_whole_and_fractional_serials(self):
+        serials = np.array([1, 59, 60, 61, 45967, 45967.5, 45967.25, 0.5, 100.99999999999, 100.999999999999])
+        
+        dates = _excel_serials_to_dates(serials).astype("datetime64[D]").tolist()
+        
+        self.assertEqual(dates, [
+            date(1900, 1, 1), date(1900, 2, 28), date(1900, 2, 28), date(1900, 3, 1),
+            date(2025, 11, 6), date(2025, 11, 6), date(2025, 11, 6), date(1899, 12, 31),
+            # A fraction that rounds up to a whole microsecond carries into the next day, as timedelta does
+            date(1900, 4, 9), date(1900, 4, 10)
+        ])
+        self.assertEqual(dates, [_parse_date_text(str(serial)) for serial in serials.tolist()])
+    
+    def test_out_of_range_serials_become_nat(self):
+        serials = np.array([2958465, 2958466, 3e6, -693594, -693595, -1e9])
+        
+        dates = _excel_serials_to_dates(serials)
+        
+        self.assertEqual(np.isnat(dates).tolist(), [False, True, True, False, True, True])
+        self.assertEqual(dates[0].astype("datetime64[D]").tolist(), date(9999, 12, 31))
+        self.assertEqual(dates[3].astype("datetime64[D]").tolist(), date(1, 1, 1))
+        self.assertEqual([_parse_date_text(str(serial)) is None for serial in serials.tolist()], np.isnat(dates).tolist())
+    
+    def test_serials_mixed_with_datetimes_and_text(self):
+        values = [
+            45967, datetime(2025, 11, 5, 13, 30), "06-Nov-25", 45967.75, "45968", "junk", None,
+            True, 3e6, np.int64(45969), np.float64(45970.5), date(2025, 11, 1), 1e300
+        ]
+        records = pd.DataFrame({"Audit Date": pd.Series(values, dtype=object)})
+        processor = DataProcessor(Config())
+        
+        dates = processor.get_date_series(records, "Audit Date")
+        
+        parsed = [None if pd.isna(value) else value.date() for value in dates]
+        self.assertEqual(parsed, [
+            date(2025, 11, 6), date(2025, 11, 5), date(2025, 11, 6), date(2025, 11, 6), date(2025, 11, 7), None, None,
+            None, None, date(2025, 11, 8), date(2025, 11, 9), date(2025, 11, 1), None
+        ])
+        self.assertEqual(parsed, [processor.parse_date(value) for value in values])
+
+
+class PartitionByDateTest(unittest.TestCase):
+    """partition_by_date returns what filter_records_by_date and filter_records_mtd return separately."""
+    
+    def make_processor(self):
+        processor = DataProcessor(Config())
+        processor.date_column = "Audit Date"
+        return processor
+    
+    def assertMatchesFilters(self, records, selected_date):
+        date_records, mtd_records = self.make_processor().partition_by_date(records, selected_date)
+        
+        filters = self.make_processor()
+        pd.testing.assert_frame_equal(date_records, filters.filter_records_by_date(records, selected_date))
+        pd.testing.assert_frame_equal(mtd_records, filters.filter_records_mtd(records, selected_date))
+        return date_records["Agent Name"].tolist(), mtd_records["Agent Name"].tolist()
+    
+    def test_matches_the_separate_filters(self):
+        records = pd.DataFrame({
+            "Agent Name": list("abcdefghij"),
+            "Audit Date": [
+                "15-Oct-25", datetime(2025, 11, 1, 9, 30), "junk", "2025-11-06 10:00:00", None,
+                45967, "01/11/2025", "", "31-Nov-25", datetime(2025, 12, 2)
+            ]
+        }, dtype=object)
+        
+        # The first of the month still reaches back to the start of the earliest month with data
+        self.assertEqual(self.assertMatchesFilters(records, date(2025, 11, 1)), (["b", "g"], ["a", "b", "g"]))
+        self.assertEqual(self.assertMatchesFilters(records, date(2025, 11, 6)), (["d", "f"], ["a", "b", "d", "f", "g"]))
+        self.assertEqual(self.assertMatchesFilters(records, date(2025, 10, 1)), ([], []))
+        self.assertEqual(self.assertMatchesFilters(records, date(2025, 9, 30)), ([], []))
+    
+    def test_no_parseable_dates(self):
+        records = pd.DataFrame({"Agent Name": ["a", "b"], "Audit Date": ["junk", None]}, dtype=object)
+        
+        self.assertEqual(self.assertMatchesFilters(records, date(2025, 11, 1)), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
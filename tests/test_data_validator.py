@@ -0,0 +1,43 @@
+"""
+Tests for DataValidator's Lead Status corrections.
+"""
+
+import unittest
+
+import pandas as pd
+
+from QA_Report_Helper.config import Config
+from QA_Report_Helper.data_validator import DataValidator
+
+
+class ApplyCorrectionsTest(unittest.TestCase):
+
+    def test_corrects_matching_values_and_counts_them(self):
+        statuses = ["qualifed", True, 2, "Qualified", None, "qualifed", 2.5, "disqualifed ", 3, True, 3.0]
+        records = pd.DataFrame({"Lead Status": statuses, "Agent Name": list("abcdefghijk")}, dtype=object)
+        corrections = {"qualifed": "Qualified", True: "Qualified", 2: "Disqualified"}
+        
+        corrected, count = DataValidator(Config()).apply_corrections(records, corrections)
+        
+        self.assertEqual(corrected["Lead Status"].map(repr).tolist(), [
+            "'Qualified'", "'Qualified'", "'Disqualified'", "'Qualified'", "None",
+            "'Qualified'", "2.5", "'disqualifed '", "3", "'Qualified'", "3.0"
+        ])
+        self.assertEqual(corrected["Lead Status"].tolist(), [corrections.get(status, status) for status in statuses])
+        self.assertEqual(count, 5)
+        
+        # The input records and the other columns are left as they were
+        self.assertEqual(records["Lead Status"].tolist(), statuses)
+        self.assertEqual(corrected["Agent Name"].tolist(), list("abcdefghijk"))
+    
+    def test_no_corrections(self):
+        records = pd.DataFrame({"Lead Status": ["qualifed", True]}, dtype=object)
+        
+        corrected, count = DataValidator(Config()).apply_corrections(records, {})
+        
+        self.assertIs(corrected, records)
+        self.assertEqual(count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
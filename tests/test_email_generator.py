@@ -0,0 +1,22 @@
+"""
+Tests for EmailContentGenerator's report tables.
+"""
+
+import unittest
+
+from QA_Report_Helper.email_generator import EmailContentGenerator
+
+
+class ReportTableTest(unittest.TestCase):
+
+    def test_rows_are_laid_out_by_their_own_length(self):
+        report = [["A", "B", "C"], ["x", 1], ["y", 1, 2, 3], []]
+        content = EmailContentGenerator.create_email_content("C1", {"Agent Wise Summary": report})
+        
+        expected = "\n".join(" | ".join(f"{str(cell):^15}" for cell in row) for row in report)
+        header, _, rows = expected.partition("\n")
+        self.assertIn(f"{header}\n{'-' * len(header)}\n{rows}\n", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
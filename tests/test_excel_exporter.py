@@ -0,0 +1,95 @@
+"""
+Tests for ExcelExporter's openpyxl and XlsxWriter backends.
+"""
+
+import io
+import unittest
+from datetime import date
+from importlib.util import find_spec
+
+from openpyxl import load_workbook
+
+from QA_Report_Helper.config import ExcelStyling
+from QA_Report_Helper.excel_exporter import ExcelExporter
+
+
+REPORTS = {
+    "Agent Wise Summary": [
+        ["Agent Name", "Qualified", "Disqualified", "Error %"],
+        ["Ann", 3, 1, "25.00%"],
+        ["Bob", 0, 2, "grand total "],
+        ["Grand Total", 3, 3, "50.00%"]
+    ],
+    "Combined QA Report": [["PRE QA", "POST QA"], [6, 3]],
+    "Primary Reason Disqualified": [["DQ Reason", "Count"], ["Invalid Email", 2], ["(Blank)", 1]]
+}
+
+
+def read_cells(workbook_bytes):
+    """Value and rendered formatting of every written cell, plus the column widths."""
+    ws = load_workbook(io.BytesIO(workbook_bytes)).active
+    cells = {}
+    for row in ws.iter_rows():
+        for cell in row:
+            if cell.value is None:
+                continue
+            font = cell.font
+            cells[cell.coordinate] = {
+                "value": cell.value,
+                "bold": bool(font.b),
+                # Header and grand total fonts only set bold in openpyxl, so sizes are compared on the other cells
+                "size": None if font.b else font.sz,
+                "fill": (cell.fill.fill_type, cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type else None),
+                "border": tuple(side.style for side in (cell.border.left, cell.border.right, cell.border.top, cell.border.bottom)),
+                "alignment": (cell.alignment.horizontal, cell.alignment.vertical)
+            }
+    # XlsxWriter stores adjacent columns of equal width as one range
+    widths = {
+        column: dimension.width
+        for dimension in ws.column_dimensions.values() if dimension.width
+        for column in range(dimension.min, dimension.max + 1)
+    }
+    return cells, widths
+
+
+class ExcelBackendTest(unittest.TestCase):
+
+    def export(self, use_xlsxwriter):
+        exporter = ExcelExporter(ExcelStyling(), use_xlsxwriter=use_xlsxwriter)
+        return exporter.create_excel_report(REPORTS, "C_1", date(2025, 11, 6))
+    
+    def test_openpyxl_layout_and_styles(self):
+        cells, widths = read_cells(self.export(use_xlsxwriter=False))
+        
+        self.assertEqual(cells["A1"]["value"], "Hi Team,")
+        self.assertEqual(cells["A3"]["value"], "PFB QA_Report_C_1_06-Nov-25")
+        self.assertEqual(cells["A5"]["value"], "PRE QA")
+        self.assertEqual(cells["A17"]["value"], "Best regards,")
+        
+        header = {"bold": True, "fill": ("solid", "BDD7EE"), "border": ("thin",) * 4, "alignment": ("center", "center")}
+        body = {"bold": False, "size": 11, "fill": (None, None), "border": ("thin",) * 4, "alignment": ("center", "center")}
+        self.assertEqual({key: cells["A8"][key] for key in header}, header)
+        self.assertEqual({key: cells["B9"][key] for key in body}, body)
+        # A cell reading "grand total" is highlighted inside a body row, and the closing row is highlighted whole
+        self.assertEqual({key: cells["D10"][key] for key in header}, header)
+        self.assertEqual({key: cells["B11"][key] for key in header}, header)
+        self.assertEqual({key: cells["B10"][key] for key in body}, body)
+        self.assertEqual(widths, {1: len("PFB QA_Report_C_1_06-Nov-25") + 3, 2: 12, 3: 15, 4: 15})
+    
+    @unittest.skipUnless(find_spec("xlsxwriter"), "xlsxwriter not installed")
+    def test_xlsxwriter_writes_the_same_cells_and_styles(self):
+        openpyxl_cells, openpyxl_widths = read_cells(self.export(use_xlsxwriter=False))
+        xlsxwriter_cells, xlsxwriter_widths = read_cells(self.export(use_xlsxwriter=True))
+        
+        self.assertEqual(list(xlsxwriter_cells), list(openpyxl_cells))
+        for coordinate, cell in openpyxl_cells.items():
+            with self.subTest(cell=coordinate):
+                self.assertEqual(xlsxwriter_cells[coordinate], cell)
+        # XlsxWriter adds Excel's cell padding to the stored width, which stays under one character
+        self.assertEqual(list(xlsxwriter_widths), list(openpyxl_widths))
+        for column, width in openpyxl_widths.items():
+            self.assertAlmostEqual(xlsxwriter_widths[column], width, delta=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
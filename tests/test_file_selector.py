@@ -0,0 +1,39 @@
+"""
+Tests for NetworkFile handles to workbooks on the network path.
+"""
+
+import os
+import tempfile
+import unittest
+
+from QA_Report_Helper.file_selector import NetworkFile
+
+
+class NetworkFileTest(unittest.TestCase):
+
+    def test_rewritten_file_gets_a_new_cache_key_and_size(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "report.xlsx")
+            with open(path, "wb") as f:
+                f.write(b"old")
+            
+            network_file = NetworkFile(path)
+            key = network_file.cache_key
+            
+            # Rewritten on the share after selection, before it is parsed
+            with open(path, "wb") as f:
+                f.write(b"rewritten")
+            os.utime(path, (0, 1_000_000))
+            
+            self.assertNotEqual(network_file.cache_key, key)
+            self.assertEqual(network_file.size, len(b"rewritten"))
+            self.assertEqual(network_file.modified, 1_000_000)
+    
+    def test_missing_file_fails_on_selection(self):
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(OSError):
+                NetworkFile(os.path.join(folder, "missing.xlsx"))
+
+
+if __name__ == "__main__":
+    unittest.main()